@@ -1,8 +1,10 @@
 
-from logging.config import valid_ident
+from collections import deque
 
 
 class Node():
+    __slots__ = ('val', 'left', 'right')
+
     def __init__(self, val, left,right):
         self.val = val
         self.left = left
@@ -10,13 +12,18 @@ class Node():
 
 
 def findHeight(num):
-    # base case 
-    if num is None :
-        return 0
-    elif num.left is None and num.right is None:
-        return 1
-
-    return 1 + max(findHeight(num.left), findHeight(num.right)) 
+    # explicit stack of (node, depth) instead of recursion, so a
+    # linked list shaped tree can be as deep as memory allows
+    height = 0
+    stack = [(num, 1)] if num is not None else []
+    while stack:
+        node, depth = stack.pop()
+        height = max(height, depth)
+        if node.left is not None:
+            stack.append((node.left, depth + 1))
+        if node.right is not None:
+            stack.append((node.right, depth + 1))
+    return height
 
 def findWidth(num):
 
@@ -24,26 +31,26 @@ def findWidth(num):
     # 2 3
     # 4 5 6 7 
 
-    # 1 , 2 , 3 , 2 , ....
+    # 1 , 2 , 4  -> 4
 
-    queue = [num]
-    maximum = float("-inf")
+    # deque.popleft is O(1) (list.pop(0) shifts the whole list)
+    if num is None:
+        return 0
+    queue = deque([num])
+    maximum = 0
     while queue:
         size = len(queue)
-        temp = []
+        maximum = max(maximum, size)
         for i in range(0,size):            
-            node = queue.pop(0)
+            node = queue.popleft()
             # append the child into the queue 
             if not node.left is None:
-                temp.append(node.left)
+                queue.append(node.left)
             
             if not node.right is None:
-                temp.append(node.right)
-        
-        maximum = max(maximum,len(temp))
-        queue = temp
+                queue.append(node.right)
 
-    return maximum # 2
+    return maximum
 
 
 if __name__ == '__main__':
@@ -53,6 +60,7 @@ if __name__ == '__main__':
     n1 = Node(1, n2, n3)
 
     print(findHeight(n1),3)    
+    print(findWidth(n1),2)
     
     
     
\ No newline at end of file
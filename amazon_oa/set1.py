@@ -24,26 +24,90 @@
 # 4th month = (1+3+2+4) - (5) = 2 -5 = 3 
  
 
+from array import array
+
+
+# Prefix sums: the first i months sum to prefix, the rest to total - prefix,
+# so every split is O(1) and the whole scan O(n). i runs over 1 .. n-1 (the
+# right part must not be empty). NumPy int64 input takes the vectorized path.
 def findEarliestMonth(stockPrice) :
+    if hasattr(stockPrice, 'cumsum'):
+        return _earliestMonthNumpy(stockPrice)
     n = len(stockPrice)
+    total = sum(stockPrice)
     minimum = float('inf')
     ret = -1
-    for i in range(1, n-1):
-        left = sum(stockPrice[0:i]) // (i)
-        right = sum(stockPrice[i : n]) // (n- i)
-        #print(stockPrice[0:i], " -> " , stockPrice[i:n])
-        #print(left , " ", right)
-
-        diff = abs(left-right)
-        #print("diff:" , diff)
+    left = 0
+    for i in range(1, n):
+        left += stockPrice[i - 1]
+        diff = abs(left // i - (total - left) // (n - i))
         if diff == 0:
             return i
-        
         if diff < minimum:
             minimum = diff
             ret = i
     return ret
 
+
+def _earliestMonthNumpy(stockPrice):
+    import numpy as np
+    prices = np.asarray(stockPrice, dtype=np.int64)
+    n = len(prices)
+    if n < 2:
+        return -1
+    left = np.cumsum(prices[:-1])           # left[i - 1]: first i months
+    i = np.arange(1, n, dtype=np.int64)
+    diff = np.abs(left // i - (left[-1] + prices[-1] - left) // (n - i))
+    return int(np.argmin(diff)) + 1         # argmin takes the first minimum
+
+
+# Streaming: months are appended one at a time. append() is O(1) (one
+# prefix sum); every split's right average depends on the total, so best()
+# rescans the prefix sums, O(n), but only once per batch of appends.
+class EarliestMonthStream:
+    def __init__(self, stockPrice=()):
+        self.prefix = array('q', [0])
+        self._best = None
+        self.extend(stockPrice)
+
+    def __len__(self):
+        return len(self.prefix) - 1
+
+    def append(self, price):
+        self.prefix.append(self.prefix[-1] + price)
+        self._best = None
+
+    def extend(self, prices):
+        for price in prices:
+            self.append(price)
+
+    def best(self):
+        if self._best is None:
+            self._best = self._scan()
+        return self._best
+
+    def _scan(self):
+        prefix, n = self.prefix, len(self)
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None and n >= 2:
+            sums = np.frombuffer(prefix, dtype=np.int64)
+            left = sums[1:n]
+            i = np.arange(1, n, dtype=np.int64)
+            diff = np.abs(left // i - (sums[n] - left) // (n - i))
+            return int(np.argmin(diff)) + 1
+        total = prefix[n]
+        minimum, ret = float('inf'), -1
+        for i in range(1, n):
+            diff = abs(prefix[i] // i - (total - prefix[i]) // (n - i))
+            if diff < minimum:
+                minimum, ret = diff, i
+                if diff == 0:
+                    break
+        return ret
+
 if __name__ == '__main__':
     test1 = [1,3,2,3]
     result1 = 2
@@ -58,4 +122,32 @@ if __name__ == '__main__':
     test3 = [1,3,2,4,5]
     result3 = 2
     print(findEarliestMonth(test3))
-    #assert(findEarliestMonth(test3) == result3)
\ No newline at end of file
+    #assert(findEarliestMonth(test3) == result3)
+    # the last split (n-1 months | 1 month) is the best one here
+    test4 = [3,0,0,1]
+    print(findEarliestMonth(test4))                   # 3
+
+    stream = EarliestMonthStream(test3[:3])
+    print(stream.best())                              # 2
+    stream.extend(test3[3:])
+    print(stream.best(), len(stream))                 # 2 5
+
+    import random
+    import time
+    n = 10 ** 6
+    prices = [random.randrange(1, 10 ** 4) for _ in range(n)]
+    start = time.perf_counter()
+    month = findEarliestMonth(prices)
+    print(month, "list %.2fs" % (time.perf_counter() - start))
+    start = time.perf_counter()
+    stream = EarliestMonthStream(prices)
+    stream.append(random.randrange(1, 10 ** 4))
+    print(stream.best(), "stream %.2fs" % (time.perf_counter() - start))
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        start = time.perf_counter()
+        print(findEarliestMonth(np.array(prices, dtype=np.int64)),
+              "numpy %.3fs" % (time.perf_counter() - start))
@@ -1,38 +1,42 @@
+import importlib
+import os
+import sys
+from array import array
+from typing import List
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+Graph = importlib.import_module('21Graph').Graph
+
+
 class Solution:
     def canFinish(self, numCourses: int, prerequisites: List[List[int]]) -> bool:
-        
-        adjList = { i : [] for i in range(numCourses)}
-        for u,v in prerequisites:
-            adjList[u].append(v)
-            
-        
-        visited = set()
-        
-        def dfs(node):
-            
-            # for cycles 
-            if node in visited:
-                return False
-            
-                    
-            if adjList[node] == []:
-                return True
-            
-            visited.add(node)
-            
-            
-            for val in adjList[node]:
-                if not dfs(val):
-                    return False
-            
-            # remove the course that we can visit .. 
-            visited.remove(node)
-            adjList[node] = []
-            return True
-        
-        # run for all the unconnected files .. 
-        for val in range(numCourses):
-            if not dfs(val):
-                return False
-            
-        return True
\ No newline at end of file
+
+        # Kahn's algorithm (see 13TopologicalSort.py): keep taking courses
+        # with no prerequisites left, all of them get taken iff no cycle.
+        # A CSR Graph (21Graph.py) is used as it is, u -> v: u first
+        if not hasattr(prerequisites, 'offsets'):
+            prerequisites = Graph.fromEdges(numCourses, prerequisites, reverse=True)
+        offsets, targets = prerequisites.offsets, prerequisites.targets
+        indegree = prerequisites.indegree()
+
+        # stack of courses that can be taken now
+        ready = array('i', [i for i in range(numCourses) if indegree[i] == 0])
+        taken = 0
+        while ready:
+            v = ready.pop()
+            taken += 1
+            for e in range(offsets[v], offsets[v + 1]):
+                u = targets[e]
+                indegree[u] -= 1
+                if indegree[u] == 0:
+                    ready.append(u)
+
+        return taken == numCourses
+
+
+if __name__ == '__main__':
+    print(Solution().canFinish(2, [[1, 0]]))          # True
+    print(Solution().canFinish(2, [[1, 0], [0, 1]]))  # False
+    print(Solution().canFinish(10 ** 5, [[i + 1, i] for i in range(10 ** 5 - 1)]))  # True
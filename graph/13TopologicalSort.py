@@ -1,35 +1,89 @@
+import importlib
+import os
+import sys
+from array import array
+from typing import List
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+Graph = importlib.import_module('21Graph').Graph
+
+# Kahn's algorithm, no recursion
+# prerequisites [u, v] means v has to be taken before u, i.e. edge v -> u
+#
+# adjacency is CSR: the edges out of v are targets[offsets[v] : offsets[v+1]]
+# indegree is an array('i'), and the order array doubles as the BFS queue
+# (head walks over it while new zero indegree nodes are appended), so apart
+# from a handful of int arrays nothing is allocated per node.
+# edges can also be a CSR Graph (21Graph.py) whose edge u -> v means u
+# comes before v; its arrays are used as they are.
+
+
+def topologicalOrder(numNodes, edges):
+    # returns (order, cycle)
+    #   acyclic: order has every node, cycle is empty
+    #   cyclic:  order has the nodes that could be scheduled, cycle lists
+    #            the nodes of one cycle in edge order
+    if not hasattr(edges, 'offsets'):
+        edges = Graph.fromEdges(numNodes, edges, reverse=True)
+    offsets, targets = edges.offsets, edges.targets
+    indegree = edges.indegree()
+
+    order = array('i', [i for i in range(numNodes) if indegree[i] == 0])
+    head = 0
+    while head < len(order):
+        v = order[head]
+        head += 1
+        for e in range(offsets[v], offsets[v + 1]):
+            u = targets[e]
+            indegree[u] -= 1
+            if indegree[u] == 0:
+                order.append(u)
+
+    if len(order) == numNodes:
+        return order, []
+    return order, _findCycle(numNodes, offsets, targets, indegree)
+
+
+# every node left over still has indegree > 0 from another left over node,
+# so walking predecessors among them has to run into a node seen before
+def _findCycle(numNodes, offsets, targets, indegree):
+    before = {}
+    for v in range(numNodes):
+        if indegree[v] > 0:
+            for e in range(offsets[v], offsets[v + 1]):
+                if indegree[targets[e]] > 0:
+                    before.setdefault(targets[e], v)
+    x = next(i for i in range(numNodes) if indegree[i] > 0)
+    seen = {}
+    path = []
+    while x not in seen:
+        seen[x] = len(path)
+        path.append(x)
+        x = before[x]
+    cycle = path[seen[x]:]
+    cycle.reverse()
+    return cycle
+
+
 class Solution:
     def findOrder(self, numCourses: int, prerequisites: List[List[int]]) -> List[int]:
-        adjList = {i : [] for i in range(numCourses)}
-        
-        for u,v in prerequisites:
-            adjList[u].append(v)
-            
-        visited = set()
-        cycle = set()
-        output = []
-        
-        def dfs(node):
-            if node in cycle:
-                return False
-            if node in visited:
-                return True
-           
-            
-            cycle.add(node)
-            for neigh in adjList[node]:
-                if not dfs(neigh):
-                    return False
-                
-            cycle.remove(node)
-            visited.add(node)
-            output.append(node)
-            return True
-        
-        for val in range(numCourses):
-            if not dfs(val):
-                return []
-        
-        return output
-                
-        
\ No newline at end of file
+        order, cycle = topologicalOrder(numCourses, prerequisites)
+        return [] if cycle else order.tolist()
+
+
+if __name__ == '__main__':
+    print(Solution().findOrder(2, [[1, 0]]))                          # [0, 1]
+    print(Solution().findOrder(4, [[1, 0], [2, 0], [3, 1], [3, 2]]))  # [0, 1, 2, 3]
+    print(Solution().findOrder(2, [[1, 0], [0, 1]]))                  # []
+    print(topologicalOrder(5, [[1, 0], [2, 1], [3, 2], [1, 3], [4, 0]]))
+    # (array('i', [0, 4]), [2, 3, 1])
+
+    # a 10^6 deep dependency chain, far beyond the recursion limit
+    import time
+    n = 10 ** 6
+    chain = [[i + 1, i] for i in range(n - 1)]
+    start = time.perf_counter()
+    order, cycle = topologicalOrder(n, chain)
+    print(len(order), cycle, "%.2fs" % (time.perf_counter() - start))
@@ -0,0 +1,204 @@
+# Array backed Union Find (path compression + union by rank)
+#
+# Same operations as 3pathcompression.py / 4pathcompressionAndRank.py /
+# 5NoOfProvinces.py, but root and rank are stored in typed buffers:
+#   root -> array('i')  4 bytes per node  (list: 8 byte pointer + boxed int)
+#   rank -> array('B')  1 byte per node   (rank never exceeds log2(size))
+#
+# union_many / find_many take a whole batch at once, so the attribute
+# lookups and method calls are paid once per batch instead of once per edge.
+#
+# find is iterative (no recursion limit on long chains) and the path
+# shortening strategy is selectable:
+#   'compress'  - two passes, every node on the path points at the root
+#   'halving'   - one pass, every other node points at its grandparent
+#   'splitting' - one pass, every node points at its grandparent
+
+from array import array
+from itertools import chain
+
+STRATEGIES = ('compress', 'halving', 'splitting')
+
+
+class UnionFind:
+    def __init__(self, size, strategy='compress'):
+        if strategy not in STRATEGIES:
+            raise ValueError("strategy must be one of %s, not %r"
+                             % (", ".join(STRATEGIES), strategy))
+        self.root = array('i', range(size))
+        self.rank = array('B', bytes(size))
+        self.count = size
+        self.find = getattr(self, '_find_' + strategy)
+
+    def _find_compress(self, x):
+        root = self.root
+        r = x
+        while r != root[r]:
+            r = root[r]
+        # second pass: point every node on the path at the root
+        while x != r:
+            root[x], x = r, root[x]
+        return r
+
+    def _find_halving(self, x):
+        root = self.root
+        while x != root[x]:
+            root[x] = root[root[x]]
+            x = root[x]
+        return x
+
+    def _find_splitting(self, x):
+        root = self.root
+        while x != root[x]:
+            root[x], x = root[root[x]], root[x]
+        return x
+
+    def union(self, x, y):
+        rootX = self.find(x)
+        rootY = self.find(y)
+        if rootX == rootY:
+            return False
+        rank = self.rank
+        if rank[rootX] < rank[rootY]:
+            rootX, rootY = rootY, rootX
+        self.root[rootY] = rootX
+        if rank[rootX] == rank[rootY]:
+            rank[rootX] += 1
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def getCount(self):
+        return self.count
+
+    # edges: (E, 2) numpy array, list of [u, v] pairs, or a flat
+    # array('i') / memoryview laid out as u0, v0, u1, v1, ...
+    # returns the number of unions that merged two components
+    def union_many(self, edges):
+        root = self.root
+        rank = self.rank
+        merged = 0
+        for x, y in _pairs(edges):
+            # find(x) with path halving, inlined
+            while x != root[x]:
+                root[x] = root[root[x]]
+                x = root[x]
+            while y != root[y]:
+                root[y] = root[root[y]]
+                y = root[y]
+            if x == y:
+                continue
+            if rank[x] < rank[y]:
+                x, y = y, x
+            root[y] = x
+            if rank[x] == rank[y]:
+                rank[x] += 1
+            merged += 1
+        self.count -= merged
+        return merged
+
+    # returns array('i') with the root of every node in nodes
+    def find_many(self, nodes):
+        if hasattr(nodes, 'astype'):        # numpy
+            nodes = _ints(nodes)
+        root = self.root
+        out = array('i')
+        append = out.append
+        for x in nodes:
+            while x != root[x]:
+                root[x] = root[root[x]]
+                x = root[x]
+            append(x)
+        return out
+
+
+def _pairs(edges):
+    if hasattr(edges, 'astype'):         # numpy
+        edges = _ints(edges)
+        flat = True
+    else:
+        flat = isinstance(edges, (array, memoryview))
+    it = iter(edges) if flat else chain.from_iterable(edges)
+    return zip(it, it)
+
+
+# numpy array -> flat int view (not a boxed int each); int32 arrays are
+# viewed in place as 'i', anything else as int64 'q' so large ids are never
+# narrowed (an id past the last node then raises IndexError, not a wrap)
+def _ints(values):
+    if values.dtype == 'int32':
+        values = values.reshape(-1)
+        code = 'i'
+    else:
+        values = values.astype('int64', copy=False).reshape(-1)
+        code = 'q'
+    values = values if values.flags.c_contiguous else values.copy()
+    return memoryview(values).cast('B').cast(code)
+
+
+if __name__ == '__main__':
+    # Test Case
+    uf = UnionFind(10)
+    # 1-2-5-6-7 3-8-9 4
+    uf.union_many([[1, 2], [2, 5], [5, 6], [6, 7], [3, 8], [8, 9]])
+    print(uf.connected(1, 5))  # true
+    print(uf.connected(5, 7))  # true
+    print(uf.connected(4, 9))  # false
+    print(uf.getCount())       # 4
+    # 1-2-5-6-7 3-8-9-4
+    uf.union_many(array('i', [9, 4]))
+    print(uf.connected(4, 9))  # true
+    print(list(uf.find_many([1, 7, 3, 4, 0])))  # [1, 1, 3, 3, 0]
+    try:
+        import numpy as np
+        print(uf.union_many(np.zeros((0, 2), np.int64)),
+              list(uf.find_many(np.array([7, 4]))))    # 0 [1, 3]
+        uf.union_many(np.array([[0, 2 ** 32 + 1]]))
+    except ImportError:
+        pass
+    except IndexError:
+        print("id out of range")                        # id out of range
+    try:
+        UnionFind(3, 'halve')
+    except ValueError as e:
+        print(e)  # strategy must be one of compress, halving, splitting, not 'halve'
+
+    # bulk ingestion vs looping union()
+    import random
+    import time
+    n = 10 ** 6
+    edges = array('i')
+    for _ in range(n):
+        edges.append(random.randrange(n))
+        edges.append(random.randrange(n))
+
+    uf = UnionFind(n)
+    start = time.perf_counter()
+    for i in range(0, len(edges), 2):
+        uf.union(edges[i], edges[i + 1])
+    print("union loop:  %.2fs" % (time.perf_counter() - start), uf.getCount())
+
+    uf = UnionFind(n)
+    start = time.perf_counter()
+    uf.union_many(edges)
+    print("union_many:  %.2fs" % (time.perf_counter() - start), uf.getCount())
+
+    # find strategies on an adversarial chain 0 -> 1 -> ... -> n-1, the shape
+    # the un-ranked union in 3pathcompression.py builds from union(i+1, i)
+    # python 14UnionFindArray.py 10000000
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    for strategy in ('compress', 'halving', 'splitting'):
+        uf = UnionFind(n, strategy)
+        uf.root = array('i', range(1, n + 1))
+        uf.root[n - 1] = n - 1
+        find = uf.find
+        start = time.perf_counter()
+        find(0)
+        first = time.perf_counter() - start
+        for x in range(n):
+            find(x)
+        total = time.perf_counter() - start
+        print("%-9s first find %.2fs, n finds %.2fs" % (strategy, first, total))
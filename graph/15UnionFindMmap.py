@@ -0,0 +1,149 @@
+# Union Find whose state lives in a memory-mapped file
+#
+# File layout (native byte order):
+#   header  4 x int64   magic, size, count, reserved
+#   root    size x uint32  parent stored as parent + 1, 0 means "my own root"
+#   rank    size x uint8
+#
+# Because 0 encodes "x is its own root", a freshly created (zero filled,
+# sparse) file is already a valid forest of singletons, so creating and
+# opening are both O(1) - nothing is replayed or initialised per node.
+#
+# One writer may union while any number of reader processes (readonly=True)
+# call find / connected on the same pages. Parents are aligned 4 byte words
+# and only ever move to an ancestor, so a reader sees either the old or the
+# new parent and both lead to the same root. Readers do not compress.
+
+import mmap
+import os
+import struct
+
+MAGIC = 0x4d4d4655   # 'UFMM'
+HEADER = 32
+
+
+class MmapUnionFind:
+    def __init__(self, path, size=None, readonly=False):
+        if size is not None:
+            with open(path, 'wb') as f:
+                f.truncate(HEADER + 5 * size)
+        self.readonly = readonly
+        self.file = open(path, 'rb' if readonly else 'r+b')
+        try:
+            self._map(path, size)
+        except BaseException:
+            self.close()
+            raise
+
+    def _map(self, path, size):
+        fresh = size is not None
+        length = os.fstat(self.file.fileno()).st_size
+        if length < HEADER:
+            raise ValueError("%s is not a union find file" % path)
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=access)
+        # check the header before any view exports the map, so a bad file
+        # can still be closed
+        if not fresh:
+            magic, size = struct.unpack_from('2q', self.mm)
+            if magic != MAGIC or size < 0 or length < HEADER + 5 * size:
+                raise ValueError("%s is not a union find file" % path)
+        buf = memoryview(self.mm)
+        self.header = buf[:HEADER].cast('q')
+        if fresh:
+            self.header[0] = MAGIC
+            self.header[1] = size
+            self.header[2] = size
+        self.size = size
+        self.root = buf[HEADER:HEADER + 4 * size].cast('I')
+        self.rank = buf[HEADER + 4 * size:HEADER + 5 * size]
+        buf.release()
+
+    def find(self, x):
+        root = self.root
+        r = x
+        while root[r]:
+            r = root[r] - 1
+        if not self.readonly:
+            while x != r:
+                root[x], x = r + 1, root[x] - 1
+        return r
+
+    def union(self, x, y):
+        rootX = self.find(x)
+        rootY = self.find(y)
+        if rootX == rootY:
+            return False
+        rank = self.rank
+        if rank[rootX] < rank[rootY]:
+            rootX, rootY = rootY, rootX
+        self.root[rootY] = rootX + 1
+        if rank[rootX] == rank[rootY]:
+            rank[rootX] += 1
+        self.header[2] -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def getCount(self):
+        return self.header[2]
+
+    def flush(self):
+        self.mm.flush()
+
+    def close(self):
+        for view in ('root', 'rank', 'header'):
+            if hasattr(self, view):
+                getattr(self, view).release()
+        if hasattr(self, 'mm'):
+            self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _reader(args):
+    path, pairs = args
+    with MmapUnionFind(path, readonly=True) as uf:
+        return [uf.connected(x, y) for x, y in pairs]
+
+
+if __name__ == '__main__':
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = os.path.join(tempfile.mkdtemp(), 'forest.uf')
+
+    # Test Case
+    with MmapUnionFind(path, 10) as uf:
+        # 1-2-5-6-7 3-8-9 4
+        uf.union(1, 2)
+        uf.union(2, 5)
+        uf.union(5, 6)
+        uf.union(6, 7)
+        uf.union(3, 8)
+
+    # restart: reopen and keep going
+    with MmapUnionFind(path) as uf:
+        uf.union(8, 9)
+        print(uf.connected(1, 5))  # true
+        print(uf.connected(5, 7))  # true
+        print(uf.connected(4, 9))  # false
+        print(uf.getCount())       # 4
+
+        # concurrent readers against the same pages
+        with ProcessPoolExecutor(2) as pool:
+            print(list(pool.map(_reader, [(path, [(1, 7), (4, 9)]),
+                                          (path, [(3, 9), (0, 1)])])))
+            # [[True, False], [True, False]]
+
+    # 500M nodes is the same O(1) open, the file is sparse until written
+    with MmapUnionFind(path, 5 * 10 ** 8) as uf:
+        uf.union(0, 499999999)
+        print(uf.connected(499999999, 0))  # true
+    os.remove(path)
@@ -0,0 +1,152 @@
+# Dynamic connectivity (edges can be added AND removed)
+#
+# RollbackUnionFind: union by rank, no path compression, and every union
+# is pushed on a history stack so it can be undone. Without compression
+# find is O(log n) and undo is O(1).
+#
+# dynamicConnectivity answers a timeline of events offline:
+#   ('add', u, v)  ('remove', u, v)  ('query', u, v)
+# Every edge is alive over an interval of query indexes. The interval is
+# put into O(log Q) nodes of a segment tree over the queries; a DFS over
+# the tree unions the edges of a node on the way down and rolls them back
+# on the way up, so each leaf (query) sees exactly the edges alive at that
+# time. Total O((E + Q) log Q log n) instead of a rebuild per removal.
+
+from array import array
+
+
+class RollbackUnionFind:
+    def __init__(self, size):
+        self.root = array('i', range(size))
+        self.rank = array('B', bytes(size))
+        self.count = size
+        self.history = array('q')   # attached root * 2 + rank bumped
+
+    def find(self, x):
+        root = self.root
+        while x != root[x]:
+            x = root[x]
+        return x
+
+    def union(self, x, y):
+        rootX = self.find(x)
+        rootY = self.find(y)
+        if rootX == rootY:
+            return False
+        rank = self.rank
+        if rank[rootX] < rank[rootY]:
+            rootX, rootY = rootY, rootX
+        self.root[rootY] = rootX
+        bumped = rank[rootX] == rank[rootY]
+        if bumped:
+            rank[rootX] += 1
+        self.count -= 1
+        self.history.append(rootY * 2 + bumped)
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def getCount(self):
+        return self.count
+
+    def snapshot(self):
+        return len(self.history)
+
+    # undo every union made after snapshot
+    def rollback(self, snapshot):
+        history = self.history
+        root = self.root
+        while len(history) > snapshot:
+            entry = history.pop()
+            rootY = entry >> 1
+            rootX = root[rootY]
+            root[rootY] = rootY
+            if entry & 1:
+                self.rank[rootX] -= 1
+            self.count += 1
+
+
+def dynamicConnectivity(n, events):
+    queries = []
+    alive = {}          # edge -> query indexes at which copies were added
+    intervals = []      # (first query, end query, edge)
+    for op, u, v in events:
+        if op == 'query':
+            queries.append((u, v))
+            continue
+        edge = (u, v) if u < v else (v, u)
+        if op == 'add':
+            alive.setdefault(edge, []).append(len(queries))
+        elif op == 'remove':
+            if not alive.get(edge):
+                raise ValueError("remove of missing edge %s" % (edge,))
+            intervals.append((alive[edge].pop(), len(queries), edge))
+        else:
+            raise ValueError("unknown event %r" % (op,))
+    for edge, starts in alive.items():
+        for start in starts:
+            intervals.append((start, len(queries), edge))
+
+    q = len(queries)
+    if q == 0:
+        return []
+    size = 1
+    while size < q:
+        size *= 2
+    tree = [[] for _ in range(2 * size)]
+    for lo, hi, edge in intervals:
+        lo += size
+        hi += size
+        while lo < hi:
+            if lo & 1:
+                tree[lo].append(edge)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                tree[hi].append(edge)
+            lo >>= 1
+            hi >>= 1
+
+    uf = RollbackUnionFind(n)
+    answers = [False] * q
+
+    def dfs(node):
+        snapshot = uf.snapshot()
+        for u, v in tree[node]:
+            uf.union(u, v)
+        if node >= size:
+            if node - size < q:
+                u, v = queries[node - size]
+                answers[node - size] = uf.connected(u, v)
+        else:
+            dfs(2 * node)
+            dfs(2 * node + 1)
+        uf.rollback(snapshot)
+
+    dfs(1)
+    return answers
+
+
+if __name__ == '__main__':
+    # Test Case
+    uf = RollbackUnionFind(10)
+    uf.union(1, 2)
+    snap = uf.snapshot()
+    uf.union(2, 5)
+    uf.union(3, 8)
+    print(uf.connected(1, 5), uf.getCount())  # True 7
+    uf.rollback(snap)
+    print(uf.connected(1, 5), uf.getCount())  # False 9
+
+    events = [('add', 0, 1), ('add', 1, 2),
+              ('query', 0, 2),        # True
+              ('remove', 1, 2),
+              ('query', 0, 2),        # False
+              ('add', 2, 3), ('add', 3, 0),
+              ('query', 0, 2),        # True
+              ('remove', 0, 3),
+              ('query', 1, 0),        # True
+              ('query', 1, 3)]        # False
+    print(dynamicConnectivity(4, events))
+    # [True, False, True, True, False]
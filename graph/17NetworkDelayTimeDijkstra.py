@@ -0,0 +1,184 @@
+# Network Delay Time with Dijkstra (replaces the DFS in 11NetworkDelayTimeDFS.py,
+# which can re-relax the same node exponentially many times)
+#
+# times[i] = (u, v, w): signal from u to v takes w, nodes are 1 .. n
+# answer = time for the signal from k to reach every node, -1 if some never do
+#
+# DelayGraph builds the adjacency once as CSR arrays
+#   offsets[u] .. offsets[u+1]  index range of u's edges in targets / weights
+# and can then be queried for as many sources k as needed.
+#   delay(k)         binary heap, lazy deletion (stale heap entries skipped)
+#   delay(k, True)   Dial's bucket queue, for small non negative int weights:
+#                    maxW + 1 buckets used as a ring, O(E + maxW * n)
+#
+# allDelays answers delay(k) for every source (or a chosen subset) in one
+# call: the CSR arrays are copied once into a shared memory block, worker
+# processes attach to it instead of receiving a pickled copy, and each
+# worker runs Dijkstra for a slice of the sources.
+
+import heapq
+import importlib
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+Graph = importlib.import_module('21Graph').Graph
+
+INF = float("inf")
+
+
+class DelayGraph:
+    def __init__(self, times, n):
+        self.n = n
+        if not hasattr(times, 'offsets'):   # else a CSR Graph, nodes 0 .. n
+            times = Graph.fromEdges(n + 1, times, weighted=True)
+        # int32 offsets, the layout allDelays shares with its workers
+        self.offsets = array('i', times.offsets)
+        self.targets = times.targets
+        # an unweighted Graph counts every edge as 1
+        self.weights = (times.weights if times.weights is not None else
+                        array('i', [1]) * len(times.targets))
+        self.maxWeight = max(self.weights, default=0)
+
+    def shortest(self, k):
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        dist = array('d', [INF]) * (self.n + 1)
+        dist[k] = 0
+        heap = [(0, k)]
+        pop, push = heapq.heappop, heapq.heappush
+        while heap:
+            d, u = pop(heap)
+            if d > dist[u]:
+                continue            # stale entry, u was settled earlier
+            for e in range(offsets[u], offsets[u + 1]):
+                nd = d + weights[e]
+                v = targets[e]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    push(heap, (nd, v))
+        return dist
+
+    def shortestBuckets(self, k):
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        ring = self.maxWeight + 1
+        buckets = [[] for _ in range(ring)]
+        dist = array('d', [INF]) * (self.n + 1)
+        dist[k] = 0
+        buckets[0].append(k)
+        pending = 1
+        d = 0
+        while pending:
+            bucket = buckets[d % ring]
+            while bucket:
+                u = bucket.pop()
+                pending -= 1
+                if dist[u] != d:
+                    continue
+                for e in range(offsets[u], offsets[u + 1]):
+                    nd = d + weights[e]
+                    v = targets[e]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        buckets[nd % ring].append(v)
+                        pending += 1
+            d += 1
+        return dist
+
+    def delay(self, k, buckets=False):
+        dist = self.shortestBuckets(k) if buckets else self.shortest(k)
+        answer = max(dist[1:], default=0)
+        return -1 if answer == INF else int(answer)
+
+
+# returns array('q') with delay(k) for every k in sources (default 1 .. n)
+def allDelays(times, n, sources=None, workers=None, buckets=False):
+    g = times if isinstance(times, DelayGraph) else DelayGraph(times, n)
+    sources = array('i', range(1, n + 1) if sources is None else sources)
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        return array('q', (g.delay(k, buckets) for k in sources))
+
+    parts = (g.offsets, g.targets, g.weights)
+    shm = SharedMemory(create=True, size=max(1, sum(len(a) * 4 for a in parts)))
+    try:
+        at = 0
+        for a in parts:
+            shm.buf[at:at + len(a) * 4] = a.tobytes()
+            at += len(a) * 4
+        step = max(1, -(-len(sources) // (4 * workers)))
+        chunks = [sources[i:i + step] for i in range(0, len(sources), step)]
+        result = array('q')
+        with ProcessPoolExecutor(workers, initializer=_attach,
+                                 initargs=(shm.name, g.n, len(g.targets),
+                                           g.maxWeight, buckets)) as pool:
+            for part in pool.map(_sourceDelays, chunks):
+                result.extend(part)
+        return result
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+_worker = None   # (SharedMemory, DelayGraph, buckets) inside a worker
+
+
+def _attach(name, n, edges, maxWeight, buckets):
+    global _worker
+    shm = SharedMemory(name=name)
+    g = DelayGraph.__new__(DelayGraph)
+    g.n = n
+    g.maxWeight = maxWeight
+    cut = 4 * (n + 2)
+    g.offsets = shm.buf[:cut].cast('i')
+    g.targets = shm.buf[cut:cut + 4 * edges].cast('i')
+    g.weights = shm.buf[cut + 4 * edges:cut + 8 * edges].cast('i')
+    _worker = (shm, g, buckets)
+
+
+def _sourceDelays(sources):
+    shm, g, buckets = _worker
+    return array('q', (g.delay(k, buckets) for k in sources))
+
+
+class Solution:
+    def networkDelayTime(self, times: List[List[int]], n: int, k: int) -> int:
+        return DelayGraph(times, n).delay(k)
+
+
+if __name__ == '__main__':
+    print(Solution().networkDelayTime([[2, 1, 1], [2, 3, 1], [3, 4, 1]], 4, 2))  # 2
+    print(Solution().networkDelayTime([[1, 2, 1]], 2, 1))  # 1
+    print(Solution().networkDelayTime([[1, 2, 1]], 2, 2))  # -1
+    g = DelayGraph([[1, 2, 4], [1, 3, 1], [3, 2, 1], [2, 4, 0]], 4)
+    print([g.delay(k) for k in (1, 3)], [g.delay(k, True) for k in (1, 3)])
+    # [2, -1] [2, -1]
+    hops = Graph.fromEdges(5, [(1, 2), (2, 3), (1, 4), (4, 3)])
+    print(DelayGraph(hops, 4).delay(1), DelayGraph(hops, 4).delay(1, True))  # 2 2
+
+    # one graph, several sources, 10^6 edges (a ring keeps it connected)
+    import random
+    import time
+    n = 10 ** 5
+    times = [(u, u % n + 1, 10) for u in range(1, n + 1)]
+    times += [(random.randint(1, n), random.randint(1, n), random.randint(1, 10))
+              for _ in range(10 ** 6 - n)]
+    start = time.perf_counter()
+    g = DelayGraph(times, n)
+    print("build   %.2fs" % (time.perf_counter() - start))
+    for buckets in (False, True):
+        start = time.perf_counter()
+        answers = [g.delay(k, buckets) for k in (1, 2, 3)]
+        print("buckets=%s %s %.2fs per source"
+              % (buckets, answers, (time.perf_counter() - start) / 3))
+
+    print(list(allDelays([[2, 1, 1], [2, 3, 1], [3, 4, 1]], 4, workers=2)))
+    # [-1, 2, -1, -1]
+    start = time.perf_counter()
+    print(list(allDelays(g, n, sources=range(1, 9), workers=2, buckets=True)),
+          "%.2fs for 8 sources" % (time.perf_counter() - start))
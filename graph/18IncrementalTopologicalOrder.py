@@ -0,0 +1,125 @@
+# Incremental topological order (Pearce-Kelly)
+#
+# Keeps a topological order of a DAG while edges are added and removed,
+# instead of re-sorting the whole graph (13TopologicalSort.py) each time.
+# add_edge(u, v) means u has to come before v.
+#
+#   pos[x]  position of node x in the order, node[i] the node at position i
+#
+# add_edge(u, v) with pos[u] < pos[v] is already fine: O(1).
+# Otherwise only the nodes with positions in [pos[v], pos[u]] can be out of
+# place:
+#   forward  = reachable from v with pos <= pos[u]  (hitting u -> cycle)
+#   backward = reaching u with pos >= pos[v]
+# Those two sets swap into the positions they already hold, backward
+# first, each keeping its relative order. Everything else stays put, so
+# the cost depends on the affected region, not on V + E.
+# remove_edge never invalidates an order, it is O(1).
+
+from array import array
+
+
+class IncrementalTopologicalOrder:
+    def __init__(self, n, edges=()):
+        self.succ = {}
+        self.pred = {}
+        for u, v in edges:
+            self.succ.setdefault(u, set()).add(v)
+            self.pred.setdefault(v, set()).add(u)
+
+        # initial order with Kahn's algorithm
+        indegree = array('i', bytes(4 * n))
+        for v, us in self.pred.items():
+            indegree[v] = len(us)
+        self.node = array('i', [x for x in range(n) if indegree[x] == 0])
+        head = 0
+        while head < len(self.node):
+            u = self.node[head]
+            head += 1
+            for v in self.succ.get(u, ()):
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    self.node.append(v)
+        if len(self.node) != n:
+            raise ValueError("initial edges contain a cycle")
+        self.pos = array('i', bytes(4 * n))
+        for i, x in enumerate(self.node):
+            self.pos[x] = i
+
+    # returns False (and leaves the graph unchanged) if u -> v closes a cycle
+    def add_edge(self, u, v):
+        if u == v:
+            return False
+        pos = self.pos
+        lower, upper = pos[v], pos[u]
+        if lower < upper:
+            forward = self._reach(v, self.succ, lambda p: p <= upper, u)
+            if forward is None:
+                return False
+            backward = self._reach(u, self.pred, lambda p: p >= lower, None)
+            self._reorder(backward, forward)
+        self.succ.setdefault(u, set()).add(v)
+        self.pred.setdefault(v, set()).add(u)
+        return True
+
+    def remove_edge(self, u, v):
+        self.succ.get(u, set()).discard(v)
+        self.pred.get(v, set()).discard(u)
+
+    def order(self):
+        return self.node.tolist()
+
+    def before(self, u, v):
+        return self.pos[u] < self.pos[v]
+
+    # iterative DFS from start over nodes whose position passes inRegion;
+    # returns None if stop is reached
+    def _reach(self, start, adj, inRegion, stop):
+        pos = self.pos
+        seen = {start}
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            for y in adj.get(x, ()):
+                if y == stop:
+                    return None
+                if y not in seen and inRegion(pos[y]):
+                    seen.add(y)
+                    stack.append(y)
+        return seen
+
+    def _reorder(self, backward, forward):
+        pos = self.pos
+        backward = sorted(backward, key=pos.__getitem__)
+        forward = sorted(forward, key=pos.__getitem__)
+        slots = sorted(pos[x] for x in backward + forward)
+        for i, x in zip(slots, backward + forward):
+            pos[x] = i
+            self.node[i] = x
+
+
+if __name__ == '__main__':
+    topo = IncrementalTopologicalOrder(5, [(0, 1), (1, 2)])
+    print(topo.order())            # [0, 3, 4, 1, 2]
+    print(topo.add_edge(2, 3))     # True
+    print(topo.add_edge(4, 0))     # True
+    print(topo.order())            # [4, 0, 1, 2, 3]
+    print(topo.add_edge(3, 0))     # False, 0 -> 1 -> 2 -> 3 -> 0
+    topo.remove_edge(1, 2)
+    print(topo.add_edge(3, 0))     # True, the cycle needed 1 -> 2
+    print(topo.order())            # [4, 2, 3, 0, 1]
+
+    # ~1M tasks, a few new prerequisites at a time
+    import random
+    import time
+    n = 10 ** 6
+    topo = IncrementalTopologicalOrder(n, [(i, i + 1) for i in range(0, n - 1, 2)])
+    start = time.perf_counter()
+    added = 0
+    for _ in range(10 ** 4):
+        u = random.randrange(n)
+        v = min(n - 1, max(0, u + random.randint(-1000, 1000)))
+        added += topo.add_edge(u, v)
+    took = time.perf_counter() - start
+    print(added, "edges, %.1fus per add_edge" % (took / 10 ** 4 * 1e6))
+    print(all(topo.before(u, v) for u in range(n) for v in topo.succ.get(u, ())))  # True
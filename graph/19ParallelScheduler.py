@@ -0,0 +1,147 @@
+# Running a topological order in parallel
+#
+# prerequisites [u, v] means v has to finish before u starts, as in
+# 13TopologicalSort.py. Instead of running the order one task at a time:
+#
+#   schedulePlan     Kahn's algorithm one frontier at a time: level i holds
+#                    every node whose longest prerequisite chain has i nodes.
+#                    widths = tasks per level (available parallelism),
+#                    criticalPath = number of levels, or the longest chain
+#                    of cost[] when task costs are given.
+#   runSchedule      runs task(node) on a thread or process pool, either
+#                    level by level (barrier between levels) or with a
+#                    dynamic ready queue that starts a node as soon as its
+#                    last prerequisite finishes.
+#   runScheduleAsync same ready queue for coroutine tasks on asyncio.
+
+import asyncio
+import importlib
+import os
+import sys
+from array import array
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+Graph = importlib.import_module('21Graph').Graph
+
+
+# prerequisites can also be a CSR Graph (21Graph.py), u -> v: u first
+def _csr(numNodes, prerequisites):
+    if not hasattr(prerequisites, 'offsets'):
+        prerequisites = Graph.fromEdges(numNodes, prerequisites, reverse=True)
+    return prerequisites.offsets, prerequisites.targets, prerequisites.indegree()
+
+
+def schedulePlan(numNodes, prerequisites, cost=None):
+    # returns (levels, widths, criticalPath)
+    offsets, targets, indegree = _csr(numNodes, prerequisites)
+    finish = array('d', bytes(8 * numNodes))
+    level = array('i', [i for i in range(numNodes) if indegree[i] == 0])
+    levels = []
+    while level:
+        levels.append(level)
+        following = array('i')
+        for v in level:
+            finish[v] += cost[v] if cost is not None else 1
+            for e in range(offsets[v], offsets[v + 1]):
+                u = targets[e]
+                finish[u] = max(finish[u], finish[v])
+                indegree[u] -= 1
+                if indegree[u] == 0:
+                    following.append(u)
+        level = following
+    if sum(len(level) for level in levels) != numNodes:
+        raise ValueError("prerequisites contain a cycle")
+    widths = [len(level) for level in levels]
+    return levels, widths, max(finish, default=0)
+
+
+# returns [task(0), task(1), ...]; mode is 'thread' or 'process'
+# (process tasks have to be picklable, i.e. module level functions)
+def runSchedule(task, numNodes, prerequisites, mode='thread', workers=None, dynamic=True):
+    Executor = ThreadPoolExecutor if mode == 'thread' else ProcessPoolExecutor
+    results = [None] * numNodes
+    with Executor(workers) as pool:
+        if not dynamic:
+            for level in schedulePlan(numNodes, prerequisites)[0]:
+                for v, result in zip(level, pool.map(task, level)):
+                    results[v] = result
+            return results
+
+        offsets, targets, indegree = _csr(numNodes, prerequisites)
+        running = {pool.submit(task, v): v for v in range(numNodes) if indegree[v] == 0}
+        finished = 0
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                v = running.pop(future)
+                results[v] = future.result()
+                finished += 1
+                for e in range(offsets[v], offsets[v + 1]):
+                    u = targets[e]
+                    indegree[u] -= 1
+                    if indegree[u] == 0:
+                        running[pool.submit(task, u)] = u
+    if finished != numNodes:
+        raise ValueError("prerequisites contain a cycle")
+    return results
+
+
+async def runScheduleAsync(task, numNodes, prerequisites, concurrency=8):
+    offsets, targets, indegree = _csr(numNodes, prerequisites)
+    results = [None] * numNodes
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run(v):
+        async with limit:
+            return v, await task(v)
+
+    running = {asyncio.ensure_future(run(v)) for v in range(numNodes) if indegree[v] == 0}
+    finished = 0
+    while running:
+        done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            v, results[v] = future.result()
+            finished += 1
+            for e in range(offsets[v], offsets[v + 1]):
+                u = targets[e]
+                indegree[u] -= 1
+                if indegree[u] == 0:
+                    running.add(asyncio.ensure_future(run(u)))
+    if finished != numNodes:
+        raise ValueError("prerequisites contain a cycle")
+    return results
+
+
+if __name__ == '__main__':
+    import time
+
+    #   0 -> 1 -> 3
+    #   0 -> 2 -> 3    4 -> 5
+    prerequisites = [[1, 0], [2, 0], [3, 1], [3, 2], [5, 4]]
+    levels, widths, critical = schedulePlan(6, prerequisites)
+    print([list(level) for level in levels])  # [[0, 4], [1, 2, 5], [3]]
+    print(widths, critical)                   # [2, 3, 1] 3.0
+    print(schedulePlan(6, prerequisites, cost=[1, 5, 1, 1, 2, 2])[2])  # 7.0
+
+    def work(v):
+        time.sleep(0.1)
+        return v * v
+
+    for dynamic in (False, True):
+        start = time.perf_counter()
+        print(runSchedule(work, 6, prerequisites, workers=4, dynamic=dynamic),
+              "%.1fs" % (time.perf_counter() - start))   # [0, 1, 4, 9, 16, 25] 0.3s
+
+    async def awork(v):
+        await asyncio.sleep(0.1)
+        return -v
+
+    print(asyncio.run(runScheduleAsync(awork, 6, prerequisites)))  # [0, -1, -2, -3, -4, -5]
+    try:
+        runSchedule(work, 2, [[0, 1], [1, 0]])
+    except ValueError as e:
+        print(e)                                  # prerequisites contain a cycle
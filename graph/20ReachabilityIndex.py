@@ -0,0 +1,308 @@
+# Reachability index: build once, then reachable(u, v) in O(1) or near it
+#
+# For graphs that are queried far more often than they change, instead of
+# a traversal per validPath call (8DFS.py / 9BFS.py):
+#
+#   undirected: UnionFind from 14UnionFindArray.py, union_many over all
+#               edges, reachable = same root. add_edge is just a union.
+#   directed:   Tarjan SCCs (iterative) collapse every cycle into one
+#               component. Tarjan numbers components in reverse
+#               topological order, so a component only reaches components
+#               with smaller ids. On the condensation DAG every component
+#               gets interval labels from `labels` DFS traversals (GRAIL):
+#                 post[c]  post-order number
+#                 low[c]   smallest post number c reaches over DAG edges
+#               c reaches d  =>  low[c] <= low[d] and post[d] <= post[c]
+#               and, in the first traversal, d inside c's DFS subtree
+#               (enter[c] <= post[d] <= post[c]) means c reaches d.
+#               reachable(u, v) for components cu, cv:
+#                 cu == cv                     -> True
+#                 cv > cu or an interval fails -> False      O(labels)
+#                 d in cu's DFS subtree        -> True       O(1)
+#                 otherwise a DFS from cu that skips every component the
+#                 labels rule out (rare on tree-like or chain-like DAGs)
+#               3 * labels ints per component, not a C-bit closure row.
+#
+# add_edge(u, v) on a directed index:
+#   already reachable -> nothing changes
+#   otherwise         -> (u, v) goes on a short pending list that queries
+#                        search through (x reaches u_i, v_i reaches y) on
+#                        top of the labels; past maxPending edges the index
+#                        is marked stale and rebuilt on the next query
+#   while stale, or before the first build, it can't tell, so every edge
+#   counts as a change
+# onInvalidate(u, v) is called whenever the answers of the index may change.
+
+import importlib
+import os
+import sys
+from array import array
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+Graph = importlib.import_module('21Graph').Graph
+UnionFind = importlib.import_module('14UnionFindArray').UnionFind
+
+
+class ReachabilityIndex:
+    def __init__(self, n, edges, directed=False, onInvalidate=None,
+                 labels=2, maxPending=8):
+        self.n = n
+        self.directed = directed
+        self.onInvalidate = onInvalidate
+        if directed:
+            self.labels = labels
+            self.maxPending = maxPending
+            self.edges = array('i')
+            for u, v in edges:
+                self.edges.append(u)
+                self.edges.append(v)
+            self.pending = []
+            self.stale = True
+        else:
+            self.uf = UnionFind(n)
+            self.uf.union_many(edges)
+
+    def reachable(self, u, v):
+        if not self.directed:
+            return self.uf.find(u) == self.uf.find(v)
+        if self.stale:
+            self._build()
+        if self._reach(self.comp[u], self.comp[v]):
+            return True
+        if not self.pending:
+            return False
+        # paths that use the pending edges: u ~> a_i -> b_i ~> ... ~> v
+        comp, pending = self.comp, self.pending
+        cv = comp[v]
+        used = [False] * len(pending)
+        frontier = [comp[u]]
+        while frontier:
+            c = frontier.pop()
+            for i, (a, b) in enumerate(pending):
+                if not used[i] and self._reach(c, comp[a]):
+                    if self._reach(comp[b], cv):
+                        return True
+                    used[i] = True
+                    frontier.append(comp[b])
+        return False
+
+    def add_edge(self, u, v):
+        if not self.directed:
+            if self.uf.union(u, v) and self.onInvalidate:
+                self.onInvalidate(u, v)
+            return
+        self.edges.append(u)
+        self.edges.append(v)
+        if not self.stale:
+            if self.reachable(u, v):
+                return
+            self.pending.append((u, v))
+            if len(self.pending) > self.maxPending:
+                self.stale = True
+        if self.onInvalidate:
+            self.onInvalidate(u, v)
+
+    # reachability between components on the built labels
+    def _reach(self, cu, cv):
+        if cu == cv:
+            return True
+        if cv > cu:
+            return False
+        for post, low in self.intervals:
+            if low[cu] > low[cv] or post[cv] > post[cu]:
+                return False
+        post = self.intervals[0][0]
+        if self.enter[cu] <= post[cv]:
+            return True
+        # the labels can't decide: DFS from cu over the condensation,
+        # skipping components they rule out
+        offsets, targets = self.offsets, self.targets
+        seen = {cu}
+        stack = [cu]
+        while stack:
+            c = stack.pop()
+            for e in range(offsets[c], offsets[c + 1]):
+                d = targets[e]
+                if d == cv:
+                    return True
+                if d in seen or d < cv:
+                    continue
+                seen.add(d)
+                for post, low in self.intervals:
+                    if low[d] > low[cv] or post[cv] > post[d]:
+                        break
+                else:
+                    stack.append(d)
+        return False
+
+    def _build(self):
+        n, edges = self.n, self.edges
+        g = Graph.fromArrays(n, edges[0::2], edges[1::2])
+        comp, count = _tarjan(n, g.offsets, g.targets)
+        del g
+        # condensation DAG (parallel edges are left in, they only cost a
+        # repeated check in the DFS)
+        src, dst = array('i'), array('i')
+        for i in range(0, len(edges), 2):
+            a, b = comp[edges[i]], comp[edges[i + 1]]
+            if a != b:
+                src.append(a)
+                dst.append(b)
+        dag = Graph.fromArrays(count, src, dst)
+        del src, dst
+        dagOffsets, dagTargets = dag.offsets, dag.targets
+
+        self.comp = comp
+        self.offsets, self.targets = dagOffsets, dagTargets
+        self.intervals = []
+        for t in range(max(self.labels, 1)):
+            post, low, enter = _intervals(count, dagOffsets, dagTargets, t % 2 == 1)
+            self.intervals.append((post, low))
+            if t == 0:
+                self.enter = enter
+        self.pending = []
+        self.stale = False
+
+
+# one DFS over the condensation DAG (children in stored order, or reversed);
+# returns post-order number, smallest post number reachable, and the first
+# post number given out inside each component's DFS subtree
+def _intervals(count, offsets, targets, reverse):
+    post = array('i', [-1]) * count
+    low = array('i', [count]) * count
+    enter = array('i', [-1]) * count
+    counter = 0
+    nodes = array('i')
+    edge = array('i')
+    roots = range(count) if reverse else range(count - 1, -1, -1)
+    for s in roots:
+        if enter[s] != -1:
+            continue
+        enter[s] = counter
+        nodes.append(s)
+        edge.append(offsets[s + 1] - 1 if reverse else offsets[s])
+        while nodes:
+            c = nodes[-1]
+            e = edge[-1]
+            if offsets[c] <= e < offsets[c + 1]:
+                edge[-1] = e - 1 if reverse else e + 1
+                d = targets[e]
+                if enter[d] == -1:
+                    enter[d] = counter
+                    nodes.append(d)
+                    edge.append(offsets[d + 1] - 1 if reverse else offsets[d])
+                elif low[d] < low[c]:    # a DAG: d is already finished
+                    low[c] = low[d]
+                continue
+            nodes.pop()
+            edge.pop()
+            post[c] = counter
+            if counter < low[c]:
+                low[c] = counter
+            counter += 1
+            if nodes and low[c] < low[nodes[-1]]:
+                low[nodes[-1]] = low[c]
+    return post, low, enter
+
+
+# iterative Tarjan; returns (component id per node, number of components)
+# with ids in reverse topological order of the condensation
+def _tarjan(n, offsets, targets):
+    index = array('i', [-1]) * n
+    low = array('i', [0]) * n
+    onStack = bytearray(n)
+    comp = array('i', [-1]) * n
+    stack = array('i')
+    counter = 0
+    count = 0
+    for s in range(n):
+        if index[s] != -1:
+            continue
+        index[s] = low[s] = counter
+        counter += 1
+        stack.append(s)
+        onStack[s] = 1
+        work = array('i', [s])
+        edge = array('i', [offsets[s]])
+        while work:
+            v, e = work[-1], edge[-1]
+            if e < offsets[v + 1]:
+                edge[-1] = e + 1
+                w = targets[e]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    onStack[w] = 1
+                    work.append(w)
+                    edge.append(offsets[w])
+                elif onStack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            work.pop()
+            edge.pop()
+            if work and low[v] < low[work[-1]]:
+                low[work[-1]] = low[v]
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    onStack[w] = 0
+                    comp[w] = count
+                    if w == v:
+                        break
+                count += 1
+    return comp, count
+
+
+if __name__ == '__main__':
+    index = ReachabilityIndex(6, [[0, 1], [0, 2], [3, 5], [5, 4], [4, 3]])
+    print(index.reachable(1, 2), index.reachable(0, 5))  # True False
+    index.add_edge(2, 4)
+    print(index.reachable(0, 5))                         # True
+
+    changes = []
+    #   0 -> 1 <-> 2 -> 3    4
+    d = ReachabilityIndex(5, [[0, 1], [1, 2], [2, 1], [2, 3]], directed=True,
+                          onInvalidate=lambda u, v: changes.append((u, v)))
+    print(d.reachable(0, 3), d.reachable(3, 0), d.reachable(2, 1))  # True False True
+    d.add_edge(3, 4)                  # pending, no rebuild
+    d.add_edge(0, 4)                  # already reachable, no change
+    print(d.reachable(0, 4), d.reachable(4, 0), d.stale)           # True False False
+    d.add_edge(4, 0)                  # closes a cycle through pending edges
+    print(d.reachable(3, 0), changes)  # True [(3, 4), (4, 0)]
+
+    # edges added before the first build are reported too
+    early = []
+    d = ReachabilityIndex(3, [[0, 1]], directed=True,
+                          onInvalidate=lambda u, v: early.append((u, v)))
+    d.add_edge(1, 2)
+    print(d.reachable(0, 2), early)   # True [(1, 2)]
+
+    import random
+    import time
+    import tracemalloc
+    n = 10 ** 5
+    edges = [(random.randrange(n), random.randrange(n)) for _ in range(n)]
+    start = time.perf_counter()
+    d = ReachabilityIndex(n, edges, directed=True)
+    d.reachable(0, 0)
+    print("random: build %.2fs" % (time.perf_counter() - start))
+    pairs = [(random.randrange(n), random.randrange(n)) for _ in range(10 ** 5)]
+    start = time.perf_counter()
+    hits = sum(d.reachable(u, v) for u, v in pairs)
+    print("%d hits, %.0f queries/s" % (hits, len(pairs) / (time.perf_counter() - start)))
+
+    # a chain DAG: C components, labels stay O(C) memory
+    n = 10 ** 6
+    tracemalloc.start()
+    d = ReachabilityIndex(n, ((i, i + 1) for i in range(n - 1)), directed=True)
+    d.reachable(0, 0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    pairs = [(random.randrange(n), random.randrange(n)) for _ in range(10 ** 5)]
+    start = time.perf_counter()
+    hits = sum(d.reachable(u, v) for u, v in pairs)
+    print("chain n=%d: peak %.0f MB, %d hits, %.2fus/query"
+          % (n, peak / 2 ** 20, hits, (time.perf_counter() - start) * 10))
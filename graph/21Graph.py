@@ -0,0 +1,171 @@
+# Graph in CSR (compressed sparse row) form
+#
+#   offsets  array('q') n + 1   edges of u are offsets[u] .. offsets[u+1] - 1
+#   targets  array('i') m       edge e goes to targets[e]
+#   weights  array('i') m       optional
+#
+# 4 bytes per edge (8 with weights) + 8 per node, so 100M weighted edges
+# is ~0.8 GB, against ~10 GB as a dict / list of python lists of ints.
+#
+# The algorithms in this folder build their adjacency with it, and take a
+# Graph wherever they take an edge list:
+#   17NetworkDelayTimeDijkstra  DelayGraph(g, n) / networkDelayTime(g, n, k)
+#                               (nodes 1 .. n, so g has n + 1 nodes)
+#   13TopologicalSort           topologicalOrder(n, g), findOrder(n, g)
+#   12CourseSchedule1           canFinish(n, g)
+#   19ParallelScheduler         schedulePlan(n, g), runSchedule(..., g)
+#   9BFS                        Reachability(n, g, directed)
+#   8DFS                        validPath(n, g, start, end)
+#   5NoOfProvinces              findCircleNum(g)
+#   7ConnectedComponents,       g.edges() wherever an edge list goes
+#   6ValidTree, 20Reachability
+# For 12 / 13 / 19 an edge u -> v means u has to come before v; their
+# [u, v] prerequisite lists are the other way round, fromEdges(...,
+# reverse=True).
+#
+# File names start with a digit, so `import` can't name them. Files that
+# need a sibling (here and in ../trees) add their own directory to
+# sys.path once and load it by name:
+#   _HERE = os.path.dirname(os.path.abspath(__file__))
+#   if _HERE not in sys.path:
+#       sys.path.append(_HERE)
+#   Graph = importlib.import_module('21Graph').Graph
+#
+# Binary file (native byte order), loaded with mmap so nothing is copied:
+#   int64 magic, n, m, weighted | offsets | targets | weights
+
+import mmap
+from array import array
+
+MAGIC = 0x48505247   # 'GRPH'
+HEADER = 32
+
+
+class Graph:
+    def __init__(self, n, offsets, targets, weights=None):
+        self.n = n
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    # edges: (u, v) or (u, v, w) tuples; undirected stores both directions,
+    # reverse stores v -> u
+    @classmethod
+    def fromEdges(cls, n, edges, directed=True, weighted=False, reverse=False):
+        src, dst = array('i'), array('i')
+        wts = array('i') if weighted else None
+        for edge in edges:
+            src.append(edge[0])
+            dst.append(edge[1])
+            if weighted:
+                wts.append(edge[2])
+        if reverse:
+            src, dst = dst, src
+        if not directed:
+            src, dst = src + dst, dst + src
+            if weighted:
+                wts = wts + wts
+        return cls.fromArrays(n, src, dst, wts)
+
+    # src / dst / weights: array('i'), lists or numpy int arrays
+    @classmethod
+    def fromArrays(cls, n, src, dst, weights=None):
+        if hasattr(src, 'argsort'):
+            import numpy as np
+            order = src.argsort(kind='stable')
+            offsets = np.zeros(n + 1, np.int64)
+            np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+            targets = array('i', dst[order].astype(np.int32).tobytes())
+            weights = (None if weights is None else
+                       array('i', weights[order].astype(np.int32).tobytes()))
+            return cls(n, array('q', offsets.tobytes()), targets, weights)
+
+        # counting sort by source
+        offsets = array('q', bytes(8 * (n + 1)))
+        for u in src:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+        targets = array('i', bytes(4 * len(src)))
+        wts = None if weights is None else array('i', bytes(4 * len(src)))
+        fill = offsets[:]
+        for e in range(len(src)):
+            u = src[e]
+            targets[fill[u]] = dst[e]
+            if wts is not None:
+                wts[fill[u]] = weights[e]
+            fill[u] += 1
+        return cls(n, offsets, targets, wts)
+
+    @classmethod
+    def fromBinary(cls, path):
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(mm)
+        magic, n, m, weighted = buf[:HEADER].cast('q')
+        if magic != MAGIC:
+            raise ValueError("%s is not a graph file" % path)
+        at = HEADER
+        offsets = buf[at:at + 8 * (n + 1)].cast('q')
+        at += 8 * (n + 1)
+        targets = buf[at:at + 4 * m].cast('i')
+        at += 4 * m
+        weights = buf[at:at + 4 * m].cast('i') if weighted else None
+        return cls(n, offsets, targets, weights)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(array('q', [MAGIC, self.n, len(self.targets),
+                                self.weights is not None]).tobytes())
+            for part in (self.offsets, self.targets, self.weights):
+                if part is not None:
+                    f.write(part)
+
+    def neighbors(self, u):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def edges(self):
+        offsets, targets = self.offsets, self.targets
+        for u in range(self.n):
+            for e in range(offsets[u], offsets[u + 1]):
+                yield u, targets[e]
+
+    def reverse(self):
+        src = array('i', bytes(4 * len(self.targets)))
+        for u in range(self.n):
+            for e in range(self.offsets[u], self.offsets[u + 1]):
+                src[e] = u
+        return Graph.fromArrays(self.n, self.targets, src, self.weights)
+
+    def indegree(self):
+        count = array('i', bytes(4 * self.n))
+        for v in self.targets:
+            count[v] += 1
+        return count
+
+    def __len__(self):
+        return len(self.targets)
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+
+    g = Graph.fromEdges(4, [(0, 1, 5), (0, 2, 1), (2, 1, 1), (1, 3, 2)], weighted=True)
+    print(list(g.offsets), list(g.targets), list(g.weights))
+    # [0, 2, 3, 4, 4] [1, 2, 3, 1] [5, 1, 2, 1]
+    print(list(g.neighbors(0)), list(g.edges()))
+    # [1, 2] [(0, 1), (0, 2), (1, 3), (2, 1)]
+    print(list(g.reverse().edges()), list(g.indegree()))
+    # [(1, 0), (1, 2), (2, 0), (3, 1)] [0, 2, 1, 1]
+    print(list(Graph.fromEdges(3, [(1, 0), (2, 1)], reverse=True).edges()))
+    # [(0, 1), (1, 2)]
+    print(list(Graph.fromEdges(3, [(0, 1), (1, 2)], directed=False).edges()))
+    # [(0, 1), (1, 2), (1, 0), (2, 1)]
+
+    path = os.path.join(tempfile.mkdtemp(), 'graph.bin')
+    g.save(path)
+    h = Graph.fromBinary(path)
+    print(h.n, list(h.offsets), list(h.targets), list(h.weights))
+    # 4 [0, 2, 3, 4, 4] [1, 2, 3, 1] [5, 1, 2, 1]
+    os.remove(path)
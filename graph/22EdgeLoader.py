@@ -0,0 +1,116 @@
+# Edge list loading without a python object per edge
+#
+# Binary edge file: rows of int32 (or int64) u, v[, w], native byte order.
+#   loadBinaryEdges(path)  mmaps the file and returns memoryviews over it:
+#                          edges  flat u0, v0, u1, v1, ... (unweighted)
+#                          or src / dst / weights strided views (weighted)
+#                          nothing is read until a page is touched.
+# Text edge file: "u v" or "u v w" per line.
+#   readTextEdges(path)    reads big chunks and yields each as one flat
+#                          array('i'); a line cut at a chunk boundary is
+#                          carried over to the next chunk.
+#   textToBinary(src, dst) converts a text dump once, then load it with
+#                          loadBinaryEdges every run.
+#
+# The flat buffers go straight into
+#   14UnionFindArray   UnionFind(n).union_many(edges)
+#   7ConnectedComponents parallelComponents(n, edges)
+#   21Graph            Graph.fromArrays(n, src, dst, weights)
+# and edgePairs(edges) turns one into (u, v) pairs for the per edge APIs
+# (validTreeStream, countComponents, ...).
+
+import mmap
+import os
+from array import array
+
+
+def loadBinaryEdges(path, typecode='i', weighted=False):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # an empty edge list; mmap refuses empty files
+            flat = memoryview(array(typecode))
+        else:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            flat = memoryview(mm).cast(typecode)
+    if not weighted:
+        return flat
+    return flat[0::3], flat[1::3], flat[2::3]
+
+
+def readTextEdges(path, chunkSize=1 << 24, typecode='i'):
+    with open(path, 'rb') as f:
+        rest = b''
+        while True:
+            chunk = f.read(chunkSize)
+            if not chunk:
+                break
+            chunk = rest + chunk
+            cut = chunk.rfind(b'\n') + 1
+            rest = chunk[cut:]
+            yield array(typecode, map(int, chunk[:cut].split()))
+        if rest.strip():
+            yield array(typecode, map(int, rest.split()))
+
+
+def textToBinary(src, dst, chunkSize=1 << 24, typecode='i'):
+    count = 0
+    with open(dst, 'wb') as out:
+        for part in readTextEdges(src, chunkSize, typecode):
+            part.tofile(out)
+            count += len(part)
+    return count
+
+
+def edgePairs(edges):
+    it = iter(edges)
+    return zip(it, it)
+
+
+if __name__ == '__main__':
+    import importlib
+    import random
+    import sys
+    import tempfile
+    import time
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    UnionFind = importlib.import_module('14UnionFindArray').UnionFind
+    Graph = importlib.import_module('21Graph').Graph
+
+    folder = tempfile.mkdtemp()
+    text = os.path.join(folder, 'edges.txt')
+    binary = os.path.join(folder, 'edges.bin')
+    with open(text, 'w') as f:
+        f.write("0 1\n1 2\n3 4\n")
+    print(list(edgePairs(next(readTextEdges(text)))))  # [(0, 1), (1, 2), (3, 4)]
+    textToBinary(text, binary)
+    edges = loadBinaryEdges(binary)
+    uf = UnionFind(5)
+    uf.union_many(edges)
+    print(uf.getCount(), uf.connected(0, 2))           # 2 True
+    del edges
+    empty = os.path.join(folder, 'empty.bin')
+    open(empty, 'wb').close()
+    print(len(loadBinaryEdges(empty)), [len(part) for part in loadBinaryEdges(empty, weighted=True)])
+    # 0 [0, 0, 0]
+
+    weighted = os.path.join(folder, 'weighted.bin')
+    with open(weighted, 'wb') as f:
+        array('i', [0, 1, 7, 1, 2, 3]).tofile(f)
+    g = Graph.fromArrays(3, *loadBinaryEdges(weighted, weighted=True))
+    print(list(g.edges()), list(g.weights))            # [(0, 1), (1, 2)] [7, 3]
+
+    n = 10 ** 6
+    with open(text, 'w') as f:
+        for _ in range(n):
+            f.write("%d %d\n" % (random.randrange(n), random.randrange(n)))
+    start = time.perf_counter()
+    print(textToBinary(text, binary) // 2, "edges text -> binary %.2fs"
+          % (time.perf_counter() - start))
+    start = time.perf_counter()
+    edges = loadBinaryEdges(binary)
+    uf = UnionFind(n)
+    uf.union_many(edges)
+    print(uf.getCount(), "components, mmap + union_many %.2fs"
+          % (time.perf_counter() - start))
+    del edges
@@ -3,10 +3,13 @@ class UnionFind:
         self.arr = [i for i in range(size)]
 
     def find(self, x):
-        if x == self.arr[x]:
-            return x
-        self.arr[x] = self.find(self.arr[x])
-        return self.arr[x]
+        r = x
+        while r != self.arr[r]:
+            r = self.arr[r]
+        # path compression, second pass without recursion
+        while x != r:
+            self.arr[x], x = r, self.arr[x]
+        return r
 
     def union(self,x,y):
         xVal = self.find(x)
@@ -1,3 +1,15 @@
+import importlib
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, compress, repeat
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+components = importlib.import_module('7ConnectedComponents')
+
 # Union Find Class 
 class UnionFind:
     def __init__(self, size):
@@ -7,10 +19,13 @@ class UnionFind:
 
     # path compression 
     def find(self, x):
-        if x == self.root[x]:
-            return x
-        self.root[x] = self.find(self.root[x]) #recursive
-        return self.root[x]
+        r = x
+        while r != self.root[r]:
+            r = self.root[r]
+        # path compression, second pass without recursion
+        while x != r:
+            self.root[x], x = r, self.root[x]
+        return r
 
     # the union function by rank
     def union(self, x, y):
@@ -30,14 +45,142 @@ class UnionFind:
         return self.count
 
 class Solution:
-    def findCircleNum(self, isConnected):
-        if not isConnected or len(isConnected) == 0:
+    # isConnected may be any of
+    #   dense n x n matrix       list of lists or square numpy array
+    #   scipy.sparse matrix      anything with .tocoo()
+    #   (indptr, indices)        CSR arrays
+    #   Graph                    CSR Graph from 21Graph.py
+    #   (row, col, data)         COO triple, n= or max index + 1
+    #   [[u, v], ...]            edge list, pass n=
+    #   numpy (E, 2) array       edge list, n= or max index + 1 (always
+    #                            pass n= for E == 2, or it is read as a
+    #                            2 x 2 matrix)
+    # only the nonzero coordinates are visited, so sparse inputs never
+    # touch the n^2 cells of a dense matrix
+    def findCircleNum(self, isConnected, workers=1, n=None):
+        if isConnected is None:
             return 0
-        n = len(isConnected)
+        if workers > 1:
+            return parallelProvinces(isConnected, workers, n)[0]
+        n, edges = nonzeroEdges(isConnected, n)
         uf = UnionFind(n)
+        it = iter(edges)
+        for row, col in zip(it, it):
+            uf.union(row, col)
+        return uf.getCount()
+
+
+# returns (n, edges) with edges a flat array('i') u0, v0, u1, v1, ...
+def nonzeroEdges(isConnected, n=None):
+    if hasattr(isConnected, 'tocoo'):                   # scipy.sparse
+        coo = isConnected.tocoo()
+        n = coo.shape[0]
+        rows, cols = coo.row.tolist(), coo.col.tolist()
+    elif hasattr(isConnected, 'nonzero') and (
+            n is None and isConnected.ndim == 2
+            and isConnected.shape[0] == isConnected.shape[1]):   # numpy dense
+        n = len(isConnected)
+        rows, cols = (array('i', a.astype('int32').tobytes())
+                      for a in isConnected.nonzero())
+    elif hasattr(isConnected, 'astype'):                # numpy (E, 2) edges
+        flat = array('i', isConnected.astype('int32').tobytes())
+        rows, cols = flat[::2], flat[1::2]
+        if n is None:
+            n = max(flat, default=-1) + 1
+    elif hasattr(isConnected, 'offsets') or (
+            isinstance(isConnected, tuple) and len(isConnected) == 2):
+        if hasattr(isConnected, 'offsets'):             # CSR Graph
+            indptr, indices = isConnected.offsets, isConnected.targets
+        else:                                           # CSR arrays
+            indptr, indices = isConnected
+        n = len(indptr) - 1
+        rows = chain.from_iterable(repeat(i, indptr[i + 1] - indptr[i]) for i in range(n))
+        cols = indices
+    elif isinstance(isConnected, tuple) and len(isConnected) == 3:
+        row, col, data = isConnected                    # COO
+        rows = list(compress(row, data))
+        cols = list(compress(col, data))
+        if n is None:
+            n = max(max(rows, default=-1), max(cols, default=-1)) + 1
+    elif n is not None:                                 # edge list
+        flat = array('i', chain.from_iterable(isConnected))
+        rows, cols = flat[::2], flat[1::2]
+    else:                                               # dense list of lists
+        n = len(isConnected)
+        rows = array('i')
+        cols = array('i')
         for row in range(n):
-            for col in range(row+1,n):
-                if isConnected[row][col] == 1:
-                    uf.union(row, col)
-        return uf.getCount
+            # bulk pick the nonzero columns right of the diagonal
+            hits = list(compress(range(row + 1, n), isConnected[row][row + 1:]))
+            rows.extend(repeat(row, len(hits)))
+            cols.extend(hits)
+
+    edges = array('i')
+    for row, col in zip(rows, cols):
+        if row != col:
+            edges.append(row)
+            edges.append(col)
+    return n, edges
+
+
+# Parallel mode: for a dense list of lists every worker scans a band of
+# rows of the upper triangle, for the other inputs every worker gets a
+# slice of the nonzero edges. Workers build a local forest over the nodes
+# they saw, the forests are merged pairwise in the workers, and each node
+# is labelled with its province id 0 .. count-1 (the forest helpers are
+# the ones of parallelComponents in 7ConnectedComponents.py)
+def parallelProvinces(isConnected, workers=None, n=None):
+    workers = workers or os.cpu_count()
+    if isinstance(isConnected, list) and n is None:
+        n = len(isConnected)
+        step = max(1, -(-n // workers))
+        shards = [(start, isConnected[start:start + step]) for start in range(0, n, step)]
+        work = _bandForest
+    else:
+        n, edges = nonzeroEdges(isConnected, n)
+        step = max(2, -(-len(edges) // (2 * workers)) * 2)
+        shards = [edges[i:i + step] for i in range(0, len(edges), step)]
+        work = components.shardForest
+
+    with ProcessPoolExecutor(workers) as pool:
+        forest = components.reduceForests(pool, list(pool.map(work, shards)))
+    return components.labelComponents(n, forest)
+
+
+def _bandForest(band):
+    start, rows = band
+    edges = array('i')
+    for i, row in enumerate(rows, start):
+        for col in compress(range(i + 1, len(row)), row[i + 1:]):
+            edges.append(i)
+            edges.append(col)
+    return components.shardForest(edges)
+
+
+if __name__ == '__main__':
+    isConnected = [[1, 1, 0, 0],
+                   [1, 1, 0, 0],
+                   [0, 0, 1, 1],
+                   [0, 0, 1, 1]]
+    print(Solution().findCircleNum(isConnected))             # 2
+    print(Solution().findCircleNum(isConnected, workers=2))  # 2
+    print(parallelProvinces([[1, 0, 1], [0, 1, 0], [1, 0, 1]], 2))
+    # (2, array('i', [0, 1, 0]))
+
+    # sparse inputs for the same 4 node graph
+    print(Solution().findCircleNum(([0, 1, 2, 3, 4], [1, 0, 3, 2])))        # 2  CSR
+    print(Solution().findCircleNum(([0, 2, 0], [1, 3, 2], [1, 1, 0]), n=4)) # 2  COO
+    print(Solution().findCircleNum([[0, 1], [2, 3]], n=4))                  # 2  edges
+    print(Solution().findCircleNum([[0, 1], [2, 3]], workers=2, n=5))       # 3
+    try:
+        import numpy as np
+        edgeArray = np.array([[0, 1], [2, 3], [3, 4]])
+        print(Solution().findCircleNum(edgeArray, n=6))                     # 3  (E, 2)
+    except ImportError:
+        pass
 
+    # 100k nodes, a few edges per node, no 10^10 cell matrix
+    import random
+    n = 10 ** 5
+    edges = [[random.randrange(n), random.randrange(n)] for _ in range(n // 2)]
+    print(Solution().findCircleNum(edges, n=n))
@@ -2,14 +2,15 @@ class UnionFind:
     def __init__(self, size):
         self.root = [i for i in range(size)]
         self.rank = [1] * size
-        print(self.root)
-        print(self.rank)
 
     def find(self, x):
-        if x == self.root[x]:
-            return x
-        self.root[x] = self.find(self.root[x])
-        return self.root[x]
+        r = x
+        while r != self.root[r]:
+            r = self.root[r]
+        # path compression, second pass without recursion
+        while x != r:
+            self.root[x], x = r, self.root[x]
+        return r
 
     def union(self, x, y):
         rootX = self.find(x)
@@ -21,21 +22,58 @@ class UnionFind:
                 self.root[rootX] = rootY
             elif self.rank[rootX] > self.rank[rootY]:
                 self.root[rootY] = rootX
-            else: 
+            else:
                 self.root[rootX] = rootY
-                self.rank[rootX] += 1
+                self.rank[rootY] += 1
         return True
 
 class Solution:
     def validTree(self, n, edges) -> bool:
         if len(edges) != n-1:
             return False
-        else:
-           
-            uf = UnionFind(n)
-            for row,val in edges:
-                if not uf.union(row,val):
-                    return False
-        return True
-                    
-                    
\ No newline at end of file
+        return self.validTreeStream(n, edges)[0]
+
+    # edges can be any iterable (a generator, readEdges(path), ...) and is
+    # consumed once without being stored, so memory is O(n) however big the
+    # dump is. Stops at the first edge that closes a cycle.
+    # returns (isTree, offendingEdge or None)
+    def validTreeStream(self, n, edges):
+        uf = UnionFind(n)
+        count = 0
+        for u, v in edges:
+            count += 1
+            if not uf.union(u, v):
+                return False, (u, v)
+        # n-1 edges without a cycle on n nodes is connected
+        return count == n - 1, None
+
+
+# stream "u v" pairs from a text edge dump, one per line
+def readEdges(path):
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                yield int(parts[0]), int(parts[1])
+
+
+if __name__ == '__main__':
+    print(Solution().validTree(5, [[0, 1], [0, 2], [0, 3], [1, 4]]))          # True
+    print(Solution().validTree(5, [[0, 1], [1, 2], [2, 3], [1, 3], [1, 4]]))  # False
+    print(Solution().validTreeStream(5, iter([(0, 1), (1, 2), (2, 0), (3, 4)])))
+    # (False, (2, 0))
+    print(Solution().validTreeStream(4, iter([(0, 1), (2, 3)])))
+    # (False, None)  forest, not connected
+
+    import os
+    import tempfile
+    n = 10 ** 6
+    path = os.path.join(tempfile.mkdtemp(), 'edges.txt')
+    with open(path, 'w') as f:
+        for i in range(1, n):
+            f.write("%d %d\n" % (i // 2, i))    # heap shaped tree
+    print(Solution().validTreeStream(n, readEdges(path)))  # (True, None)
+    with open(path, 'a') as f:
+        f.write("7 3\n")
+    print(Solution().validTreeStream(n, readEdges(path)))  # (False, (7, 3))
+    os.remove(path)
@@ -1,39 +1,151 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import List
+
+
 class UnionFind:
     def __init__(self, size):
         self.root = [i for i in range(size)]
         self.rank = [1] * size
         self.count = size
-        
+
     def find(self, x):
-        if x == self.root[x]:
-            return x
-        self.root[x] = self.find(self.root[x]) # recursive
-        return self.root[x]
-    
+        r = x
+        while r != self.root[r]:
+            r = self.root[r]
+        # path compression, second pass without recursion
+        while x != r:
+            self.root[x], x = r, self.root[x]
+        return r
+
     def union(self, x ,y):
         rootX = self.find(x)
         rootY = self.find(y)
         if rootX != rootY:
-            if self.rank[rootX] < self.rank[rootY]:
+            if self.rank[rootX] > self.rank[rootY]:
                 self.root[rootY] = rootX
-            elif self.rank[rootX] > self.rank[rootY]:
+            elif self.rank[rootX] < self.rank[rootY]:
                 self.root[rootX] = rootY
             else:
                 self.root[rootY] = rootX
-                self.rank[rootY] += 1
+                self.rank[rootX] += 1
             self.count -= 1
-            
+
     def getCount(self):
         return self.count
 
     def connected(self, x, y):
         return self.find(x) == self.find(y)
-    
+
 class Solution:
-    def countComponents(self, n: int, edges: List[List[int]]) -> int:
+    def countComponents(self, n: int, edges: List[List[int]], workers: int = 1) -> int:
+        if workers > 1:
+            return parallelComponents(n, edges, workers)[0]
+
         uf = UnionFind(n)
         for row,col in edges:
             uf.union(row,col)
-            
+
         return uf.getCount()
-        
\ No newline at end of file
+
+
+# Parallel mode
+# 1. split the edge list into one shard per worker
+# 2. every worker builds a local forest over just the nodes its shard
+#    touches and sends back (node, root) pairs for the non-root nodes
+#    (at most n pairs, however many edges the shard had)
+# 3. the pair arrays are edges themselves, so forests are merged two at a
+#    time in the workers (a tree reduction, log2(shards) rounds) until one
+#    is left
+# 4. the parent only labels every node with a component id 0 .. count-1
+# shardForest / reduceForests / labelComponents are shared with
+# parallelProvinces in 5NoOfProvinces.py
+def parallelComponents(n, edges, workers=None):
+    workers = workers or os.cpu_count()
+    if not isinstance(edges, (array, memoryview)):
+        edges = array('i', chain.from_iterable(edges))
+    step = max(2, -(-len(edges) // (2 * workers)) * 2)
+    shards = [edges[i:i + step] for i in range(0, len(edges), step)]
+    if isinstance(edges, memoryview):    # e.g. mmap'ed, see 22EdgeLoader.py
+        shards = [array(edges.format, shard) for shard in shards]
+
+    with ProcessPoolExecutor(workers) as pool:
+        forest = reduceForests(pool, list(pool.map(shardForest, shards)))
+    return labelComponents(n, forest)
+
+
+# flat edges u0, v0, u1, v1, ... -> flat (node, root) pairs
+def shardForest(edges):
+    parent = {}          # roots are simply absent
+    it = iter(edges)
+    for x, y in zip(it, it):
+        x = _find(parent, x)
+        y = _find(parent, y)
+        if x != y:
+            parent[y] = x
+
+    pairs = array('i')
+    for x in parent:
+        pairs.append(x)
+        pairs.append(_find(parent, x))
+    return pairs
+
+
+def _mergeForests(forests):
+    a, b = forests
+    return shardForest(a + b)
+
+
+def reduceForests(pool, forests):
+    while len(forests) > 1:
+        merged = list(pool.map(_mergeForests, zip(forests[0::2], forests[1::2])))
+        if len(forests) % 2:
+            merged.append(forests[-1])
+        forests = merged
+    return forests[0] if forests else array('i')
+
+
+# every pair already points at its final root
+def labelComponents(n, pairs):
+    root = array('i', range(n))
+    it = iter(pairs)
+    for x, r in zip(it, it):
+        root[x] = r
+    labels = array('i', [-1]) * n
+    count = 0
+    for x in range(n):
+        r = root[x]
+        if labels[r] == -1:
+            labels[r] = count
+            count += 1
+        labels[x] = labels[r]
+    return count, labels
+
+
+def _find(parent, x):
+    r = x
+    while r in parent:
+        r = parent[r]
+    while x != r:
+        parent[x], x = r, parent[x]
+    return r
+
+
+if __name__ == '__main__':
+    print(Solution().countComponents(5, [[0, 1], [1, 2], [3, 4]]))             # 2
+    print(Solution().countComponents(5, [[0, 1], [1, 2], [3, 4]], workers=2))  # 2
+    print(parallelComponents(6, [[0, 1], [4, 5], [1, 2], [3, 4]], 2))
+    # (2, array('i', [0, 0, 0, 1, 1, 1]))
+
+    import random
+    import time
+    n = 10 ** 6
+    edges = array('i', (random.randrange(n) for _ in range(2 * n)))
+    start = time.perf_counter()
+    print(Solution().countComponents(n, zip(edges[::2], edges[1::2])),
+          "serial %.2fs" % (time.perf_counter() - start))
+    start = time.perf_counter()
+    print(parallelComponents(n, edges)[0],
+          "parallel x%d %.2fs" % (os.cpu_count(), time.perf_counter() - start))
@@ -1,27 +1,37 @@
+import importlib
+import os
+import sys
+from typing import List
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+Graph = importlib.import_module('21Graph').Graph
+
+
 class Solution:
     def validPath(self, n: int, edges: List[List[int]], start: int, end: int) -> bool:
         
-        adjlist = [ [] for i in range(n)]
-        for a, b in edges:
-            adjlist[a].append(b)
-            adjlist[b].append(a) # both sides
-
-        print(adjlist)
+        if not hasattr(edges, 'offsets'): # else a CSR Graph, already both sides
+            edges = Graph.fromEdges(n, edges, directed=False) # both sides
+        offsets, targets = edges.offsets, edges.targets
 
         stack = [start] # stack
-        seen = set()    # set 
+        seen = bytearray(n) # one byte per node
 
-        while start:
+        while stack:
             top = stack.pop() # popping top items 
             
             if top == end:    # when destination is reached 
                 return True
 
-            if top in seen:  # if already seen 
+            if seen[top]:    # if already seen 
                 continue
+            seen[top] = 1
 
-            for val in adjlist[top]: # add the neighbours 
-                stack.append(val)
+            for e in range(offsets[top], offsets[top + 1]): # add the neighbours 
+                if not seen[targets[e]]:
+                    stack.append(targets[e])
 
         return False
 
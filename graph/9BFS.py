@@ -1,7 +1,167 @@
+# BFS / reachability
+#
+# Reachability builds a CSR adjacency once (edges out of x are
+# targets[offsets[x] : offsets[x+1]]) and answers reachability on it:
+#   bfs(start) / dfs(start)  iterative, visited marks in a bytearray
+#   validPath(start, end)    bidirectional BFS, always grows the smaller
+#                            frontier and stops when the two meet
+#   validPaths(pairs)        many (start, end) queries against one graph:
+#                            undirected -> label components once, O(1) each
+#                            directed   -> one BFS per distinct start
+# For directed graphs the backward half of the bidirectional search walks
+# a reversed CSR copy.
+# edges can also be a CSR Graph (21Graph.py); undirected ones have to be
+# stored in both directions (Graph.fromEdges(..., directed=False)).
+
+import importlib
+import os
+import sys
+from array import array
+from collections import deque
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+Graph = importlib.import_module('21Graph').Graph
+
+
+class Reachability:
+    def __init__(self, n, edges, directed=False):
+        self.n = n
+        self.directed = directed
+        if not hasattr(edges, 'offsets'):
+            edges = Graph.fromEdges(n, edges, directed=directed)
+        self.offsets, self.targets = edges.offsets, edges.targets
+        if directed:
+            reverse = edges.reverse()
+            self.rOffsets, self.rTargets = reverse.offsets, reverse.targets
+        else:
+            self.rOffsets, self.rTargets = self.offsets, self.targets
+        self.labels = None
+
+    def bfs(self, start):
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(self.n)
+        seen[start] = 1
+        queue = deque([start])
+        while queue:
+            x = queue.popleft()
+            for e in range(offsets[x], offsets[x + 1]):
+                y = targets[e]
+                if not seen[y]:
+                    seen[y] = 1
+                    queue.append(y)
+        return seen
+
+    def dfs(self, start):
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(self.n)
+        seen[start] = 1
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            for e in range(offsets[x], offsets[x + 1]):
+                y = targets[e]
+                if not seen[y]:
+                    seen[y] = 1
+                    stack.append(y)
+        return seen
+
+    def validPath(self, start, end):
+        if start == end:
+            return True
+        mark = bytearray(self.n)     # 1 = seen from start, 2 = seen from end
+        mark[start] = 1
+        mark[end] = 2
+        front, back = [start], [end]
+        while front and back:
+            if len(front) <= len(back):
+                front = _expand(front, self.offsets, self.targets, mark, 1)
+                if front is None:
+                    return True
+            else:
+                back = _expand(back, self.rOffsets, self.rTargets, mark, 2)
+                if back is None:
+                    return True
+        return False
+
+    def validPaths(self, pairs):
+        if not self.directed:
+            labels = self.componentLabels()
+            return [labels[s] == labels[t] for s, t in pairs]
+        byStart = {}
+        for i, (s, t) in enumerate(pairs):
+            byStart.setdefault(s, []).append(i)
+        answers = [False] * len(pairs)
+        for s, queries in byStart.items():
+            seen = self.bfs(s)
+            for i in queries:
+                answers[i] = bool(seen[pairs[i][1]])
+        return answers
+
+    def componentLabels(self):
+        if self.labels is None:
+            offsets, targets = self.offsets, self.targets
+            labels = array('i', [-1]) * self.n
+            count = 0
+            for root in range(self.n):
+                if labels[root] != -1:
+                    continue
+                labels[root] = count
+                stack = [root]
+                while stack:
+                    x = stack.pop()
+                    for e in range(offsets[x], offsets[x + 1]):
+                        y = targets[e]
+                        if labels[y] == -1:
+                            labels[y] = count
+                            stack.append(y)
+                count += 1
+            self.labels = labels
+        return self.labels
+
+
+# one BFS level; returns the next frontier, or None once it touches the
+# other side
+def _expand(frontier, offsets, targets, mark, side):
+    following = []
+    for x in frontier:
+        for e in range(offsets[x], offsets[x + 1]):
+            y = targets[e]
+            if mark[y] == 0:
+                mark[y] = side
+                following.append(y)
+            elif mark[y] != side:
+                return None
+    return following
+
 
 if __name__ == '__main__':
-    for x in range(2,4):
-        y =2 
-        while y <4:
-            print(x**y)
-            y+=1
\ No newline at end of file
+    g = Reachability(6, [[0, 1], [0, 2], [3, 5], [5, 4], [4, 3]])
+    print(g.validPath(0, 2), g.validPath(0, 5))            # True False
+    print(g.validPaths([(1, 2), (3, 4), (2, 4)]))          # [True, True, False]
+    d = Reachability(3, [[0, 1], [1, 2]], directed=True)
+    print(d.validPath(0, 2), d.validPath(2, 0))            # True False
+    print(d.validPaths([(0, 2), (2, 0), (1, 2)]))          # [True, False, True]
+    print(list(d.bfs(1)), list(d.dfs(1)))                  # [0, 1, 1] [0, 1, 1]
+
+    # python 9BFS.py 10000000
+    import random
+    import sys
+    import time
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    n = m // 10
+    edges = [(random.randrange(n), random.randrange(n)) for _ in range(m)]
+    start = time.perf_counter()
+    g = Reachability(n, edges, directed=True)
+    print("build %d edges %.2fs" % (m, time.perf_counter() - start))
+    pairs = [(random.randrange(n), random.randrange(n)) for _ in range(1000)]
+    start = time.perf_counter()
+    hits = sum(g.validPath(s, t) for s, t in pairs)
+    took = time.perf_counter() - start
+    print("bidirectional: %d/1000 reachable, %.0f queries/s" % (hits, 1000 / took))
+    g = Reachability(n, edges)
+    start = time.perf_counter()
+    hits = sum(g.validPaths(pairs * 100))
+    took = time.perf_counter() - start
+    print("batched undirected: %.0f queries/s" % (100000 / took))
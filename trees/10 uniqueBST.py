@@ -1,5 +1,27 @@
+# Unique binary search trees: the number of BSTs on n keys is the Catalan
+# number C(n) = binom(2n, n) / (n + 1).
+#
+#   numTrees(n)              exact, closed form. binom(2n, n) / (n + 1) is
+#                            written as a product of prime powers (Legendre:
+#                            the exponent of p in m! is sum m // p^k), and
+#                            the powers are multiplied as a balanced product
+#                            tree so the big ints being multiplied stay of
+#                            similar size. O(n log log n) small steps plus a
+#                            few big multiplications, vs O(n^2) big-int
+#                            multiplications for the DP.
+#   numTreesMod(n, mod)      C(n) % mod, mod a prime > 2n
+#   CatalanTable(limit, mod) factorial / inverse factorial tables mod a
+#                            prime, built once; table[n] is then O(1)
+#   numTreesMany(ns, mod)    answers for many n at once: one modular table
+#                            up to max(ns), or with mod=None the exact
+#                            values, memoized across calls and extended by
+#                            C(n+1) = C(n) * 2(2n+1) / (n+2)
+#   numTreesDP(n)            the original O(n^2) DP, kept as a reference
 
-def numTrees(n):
+MOD = 10 ** 9 + 7
+
+
+def numTreesDP(n):
     # numTree[3] = numTree[0] * numTree(2) +
     #            = numTree[1] * numTree(1) +
     #            = numTree[2] * numTree(0)
@@ -10,10 +32,136 @@ def numTrees(n):
     # 1 nodes = 1 tree
     for nodes in range(2, n+1):
         total = 0
-        for root in range(1,nodes):
+        for root in range(1, nodes + 1):
             left = root-1
             right = nodes - root
             total += numTree[left] * numTree[right]
         numTree[nodes] = total
 
-    return numTree[n]
\ No newline at end of file
+    return numTree[n]
+
+
+def _primes(limit):
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b'\x00\x00'[:limit + 1]
+    for p in range(2, int(limit ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return [p for p in range(limit + 1) if sieve[p]]
+
+
+def _product(values):
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def numTrees(n):
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    powers = []
+    for p in _primes(2 * n):
+        # exponent of p in (2n)! / (n! n! (n + 1))
+        e, q = 0, p
+        while q <= 2 * n:
+            e += 2 * n // q - 2 * (n // q)
+            q *= p
+        m = n + 1
+        while m % p == 0:
+            m //= p
+            e -= 1
+        if e:
+            powers.append(p ** e)
+    return _product(powers)
+
+
+class CatalanTable:
+    def __init__(self, limit, mod=MOD):
+        if 2 * limit >= mod:
+            raise ValueError("mod must be a prime > 2 * limit")
+        self.limit = limit
+        self.mod = mod
+        # fact[2n] and invFact[n + 1] for n <= limit. Stop at (2 * limit)!:
+        # one more factor could be mod itself and zero the whole table.
+        size = max(2 * limit + 1, 2)
+        fact = [1] * size
+        for i in range(1, size):
+            fact[i] = fact[i - 1] * i % mod
+        invFact = [1] * size
+        invFact[-1] = pow(fact[-1], mod - 2, mod)
+        for i in range(size - 1, 0, -1):
+            invFact[i - 1] = invFact[i] * i % mod
+        self.fact = fact
+        self.invFact = invFact
+
+    def __getitem__(self, n):
+        if not 0 <= n <= self.limit:
+            raise IndexError("n out of range")
+        # (2n)! / (n! (n + 1)!)
+        return self.fact[2 * n] * self.invFact[n] % self.mod * self.invFact[n + 1] % self.mod
+
+
+def numTreesMod(n, mod=MOD):
+    return CatalanTable(n, mod)[n]
+
+
+_exact = [1]
+
+
+def numTreesMany(ns, mod=None):
+    ns = list(ns)
+    if not ns:
+        return []
+    if mod is not None:
+        table = CatalanTable(max(ns), mod)
+        return [table[n] for n in ns]
+    if min(ns) < 0:
+        raise ValueError("n must be >= 0")
+    for n in range(len(_exact) - 1, max(ns)):
+        _exact.append(_exact[n] * 2 * (2 * n + 1) // (n + 2))
+    return [_exact[n] for n in ns]
+
+
+if __name__ == '__main__':
+    print([numTreesDP(n) for n in range(8)])    # [1, 1, 2, 5, 14, 42, 132, 429]
+    print([numTrees(n) for n in range(8)])      # [1, 1, 2, 5, 14, 42, 132, 429]
+    print(numTreesMod(100), numTrees(100) % MOD)  # 558488487 558488487
+    # small primes, down to mod = 2 * limit + 1
+    print(all(CatalanTable(limit, p)[n] == numTreesDP(n) % p
+              for p in (2, 3, 5, 7, 11, 13) for limit in range((p + 1) // 2)
+              for n in range(limit + 1)))       # True
+    print([CatalanTable(3, 7)[n] for n in range(4)], numTreesMod(5, 11))
+    # [1, 1, 2, 5] 9
+    print(numTreesMany([3, 19, 5]), numTreesMany([3, 19, 5], MOD))
+    # [5, 1767263190, 42] [5, 767263183, 42]
+
+    import time
+    n = 1000
+    start = time.perf_counter()
+    slow = numTreesDP(n)
+    dp = time.perf_counter() - start
+    start = time.perf_counter()
+    fast = numTrees(n)
+    print("n=%d  dp %.2fs  closed form %.4fs  same %s"
+          % (n, dp, time.perf_counter() - start, slow == fast))
+    n = 20000
+    start = time.perf_counter()
+    fast = numTrees(n)
+    closed = time.perf_counter() - start
+    start = time.perf_counter()
+    table = numTreesMany(range(n + 1))
+    print("n=%d  closed form %.3fs  exact table 0..n %.2fs  same %s"
+          % (n, closed, time.perf_counter() - start, table[-1] == fast))
+    n = 10 ** 6
+    start = time.perf_counter()
+    digits = numTrees(n).bit_length()
+    print("n=%d exact, %d bits %.2fs" % (n, digits, time.perf_counter() - start))
+    start = time.perf_counter()
+    numTreesMany(range(n), MOD)
+    print("n=0..%d mod p %.2fs" % (n - 1, time.perf_counter() - start))
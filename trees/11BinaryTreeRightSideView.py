@@ -1,19 +1,22 @@
+import collections
+
 def rightSideView(root):
 
     res = []
-    q = collections.deque([root])
+    q = collections.deque([root] if root else [])
 
     while q:
-        rightSide = None
         qLen = len(q)
         for i in range(qLen):
             node = q.popleft()
-            if node :
-                rightSide = node
+            # only real children are queued, no None entries
+            if node.left:
                 q.append(node.left)
+            if node.right:
                 q.append(node.right)
 
-        res.append(rightSide)
+        # last node popped is the rightmost of this level
+        res.append(node.val)
 
     return res
 
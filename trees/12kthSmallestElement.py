@@ -0,0 +1,193 @@
+# Kth smallest element in a BST
+#
+# kthSmallest(root, k): plain BST, iterative in-order walk, stops after k
+# nodes: O(h + k).
+#
+# For many order-statistic queries on a key set that keeps changing, walking
+# the tree every time is too slow. OrderStatisticTreap keeps the size of
+# every subtree in its node (a treap: BST on keys, heap on random
+# priorities, so the expected depth is O(log n)):
+#   insert(key), delete(key)   O(log n) via split / merge
+#   kth(k)                     k-th smallest, 1 based, O(log n)
+#   rank(key)                  number of keys < key, O(log n)
+#   OrderStatisticTreap.fromSorted(keys, n=None)
+#                              O(n log n) bulk load from a sorted sequence
+#                              or stream: the midpoint shape comes from
+#                              sortedIteratorToFlat in
+#                              5convertSortedIntoBST.py, and sorted random
+#                              priorities are handed out in BFS order so
+#                              the heap order holds
+# Duplicate keys are kept (multiset); delete removes one copy.
+
+import importlib
+import os
+import random
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+sortedIteratorToFlat = importlib.import_module('5convertSortedIntoBST').sortedIteratorToFlat
+
+
+def kthSmallest(root, k):
+    stack = []
+    while stack or root:
+        while root:
+            stack.append(root)
+            root = root.left
+        root = stack.pop()
+        k -= 1
+        if k == 0:
+            return root.val
+        root = root.right
+    return None
+
+
+class Node:
+    __slots__ = ('key', 'priority', 'size', 'left', 'right')
+
+    def __init__(self, key, priority=None):
+        self.key = key
+        self.priority = random.random() if priority is None else priority
+        self.size = 1
+        self.left = None
+        self.right = None
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+
+# (keys < key, keys >= key), or with inclusive=True (keys <= key, keys > key)
+def _split(node, key, inclusive=False):
+    if node is None:
+        return None, None
+    if node.key < key or (inclusive and node.key == key):
+        node.right, right = _split(node.right, key, inclusive)
+        return _update(node), right
+    left, node.left = _split(node.left, key, inclusive)
+    return left, _update(node)
+
+
+def _merge(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        return _update(a)
+    b.left = _merge(a, b.left)
+    return _update(b)
+
+
+class OrderStatisticTreap:
+    def __init__(self):
+        self.root = None
+
+    # keys: sorted, any iterable; n as in sortedIteratorToFlat
+    @classmethod
+    def fromSorted(cls, keys, n=None):
+        treap = cls()
+        val, left, right = sortedIteratorToFlat(keys, n)
+        n = len(val)
+        if n == 0:
+            return treap
+        # BFS index of a parent < BFS index of its children
+        priorities = sorted((random.random() for _ in range(n)), reverse=True)
+        nodes = [Node(key, priority) for key, priority in zip(val, priorities)]
+        del val, priorities
+        for i in range(n - 1, -1, -1):      # children before their parents
+            node = nodes[i]
+            if left[i] != -1:
+                node.left = nodes[left[i]]
+                node.size += node.left.size
+            if right[i] != -1:
+                node.right = nodes[right[i]]
+                node.size += node.right.size
+        treap.root = nodes[0]
+        return treap
+
+    def __len__(self):
+        return _size(self.root)
+
+    def insert(self, key):
+        left, right = _split(self.root, key)
+        self.root = _merge(_merge(left, Node(key)), right)
+
+    def delete(self, key):
+        left, rest = _split(self.root, key)
+        equal, right = _split(rest, key, inclusive=True)
+        found = equal is not None
+        if found:
+            equal = _merge(equal.left, equal.right)
+        self.root = _merge(_merge(left, equal), right)
+        return found
+
+    def kth(self, k):
+        if not 1 <= k <= len(self):
+            raise IndexError("k out of range")
+        node = self.root
+        while True:
+            leftSize = _size(node.left)
+            if k <= leftSize:
+                node = node.left
+            elif k == leftSize + 1:
+                return node.key
+            else:
+                k -= leftSize + 1
+                node = node.right
+
+    def rank(self, key):
+        node, smaller = self.root, 0
+        while node:
+            if node.key < key:
+                smaller += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return smaller
+
+
+if __name__ == '__main__':
+    TreeNode = importlib.import_module('16IterativeTraversal').TreeNode
+
+    #     3
+    #    / \
+    #   1   4
+    #    \
+    #     2
+    root = TreeNode(3, TreeNode(1, None, TreeNode(2)), TreeNode(4))
+    print(kthSmallest(root, 1), kthSmallest(root, 3))  # 1 3
+
+    treap = OrderStatisticTreap()
+    for key in [5, 1, 9, 3, 7, 3]:
+        treap.insert(key)
+    print([treap.kth(k) for k in range(1, len(treap) + 1)])  # [1, 3, 3, 5, 7, 9]
+    print(treap.rank(5), treap.rank(3), treap.rank(100))    # 3 1 6
+    print(treap.delete(3), treap.delete(4), len(treap))      # True False 5
+    print(treap.kth(2), treap.kth(3))                        # 3 5
+    treap = OrderStatisticTreap.fromSorted((x * x for x in range(6)), 6)
+    print(len(treap), treap.kth(4), treap.rank(10))          # 6 9 4
+
+    import time
+    n = 10 ** 6
+    start = time.perf_counter()
+    treap = OrderStatisticTreap.fromSorted(range(0, 2 * n, 2))
+    print("bulk load %d keys %.2fs" % (n, time.perf_counter() - start))
+    start = time.perf_counter()
+    for i in range(10 ** 5):
+        key = random.randrange(2 * n)
+        if i % 2:
+            treap.insert(key)
+        else:
+            treap.delete(key)
+        treap.kth(random.randint(1, len(treap)))
+        treap.rank(key)
+    print("%.1fus per update + kth + rank" % ((time.perf_counter() - start) * 10))
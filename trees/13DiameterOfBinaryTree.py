@@ -1,18 +1,24 @@
+import importlib
+import os
+import sys
 
-def diameterOfBinaryTree(root):
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+postorder = importlib.import_module('16IterativeTraversal').postorder
 
-    res = [0]
 
-    def dfs(root):
-        if not root:
-            return -1
+def diameterOfBinaryTree(root):
 
-        left = dfs(root.left)
-        right = dfs(root.right)
+    res = [0]
 
+    # height in edges, -1 for a missing child; postorder runs on an
+    # explicit stack, so deep trees don't hit the recursion limit
+    def combine(root, left, right):
         diameter = 2 + left + right
         res[0] = max(res[0], diameter)
 
         return 1+  max(left, right)
 
-    return res[0]
\ No newline at end of file
+    postorder(root, combine, -1)
+    return res[0]
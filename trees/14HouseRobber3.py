@@ -1,14 +1,20 @@
-def rob(root):
-    
-    # return pair = [withRoot, withoutRoot]
-    def dfs(root):
-        if not root:
-            return[0,0]
+import importlib
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+postorder = importlib.import_module('16IterativeTraversal').postorder
 
-        leftPair = dfs(root.left)
-        rightPair = dfs(root.right)
 
+def rob(root):
+    
+    # return pair = [withRoot, withoutRoot], bottom up on an explicit stack
+    def combine(root, leftPair, rightPair):
         withRoot = root.val + leftPair[1] + rightPair[1]
         withoutRoot = max(leftPair) + max(rightPair)
 
-        return[withRoot, withoutRoot]
\ No newline at end of file
+        return[withRoot, withoutRoot]
+
+    return max(postorder(root, combine, [0, 0]))
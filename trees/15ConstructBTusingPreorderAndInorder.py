@@ -0,0 +1,154 @@
+# Construct binary tree from preorder and inorder traversal
+#
+# The textbook version recurses and calls inorder.index(root) for every
+# node: O(n^2) and one python frame per level. Here the inorder position
+# of every value is looked up once in a dict, and the tree is built in a
+# single preorder sweep with an explicit stack: O(n), any depth.
+#
+# Sweep: the stack holds the path of nodes still waiting for a right child.
+# The next preorder value is the left child of the top if it comes before
+# the top in inorder; otherwise it is the right child of the last node
+# popped while the top comes before it.
+#
+#   buildTree(preorder, inorder)  TreeNode root
+#   buildFlat(preorder, inorder)  (val, left, right) arrays in the BFS
+#                                 layout of 17FlatTree.py:
+#                                 FlatTree(*buildFlat(preorder, inorder))
+#                                 val is an array('q') for int values,
+#                                 a plain list once one doesn't fit
+#
+# Values must be distinct (otherwise the traversals don't fix the tree).
+
+import importlib
+import os
+import sys
+from array import array
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+TreeNode = importlib.import_module('16IterativeTraversal').TreeNode
+
+
+def _positions(preorder, inorder):
+    if len(preorder) != len(inorder):
+        raise ValueError("preorder and inorder differ in length")
+    pos = {v: i for i, v in enumerate(inorder)}
+    if len(pos) != len(inorder):
+        raise ValueError("values must be distinct")
+    return pos
+
+
+def buildTree(preorder, inorder):
+    pos = _positions(preorder, inorder)
+    if not preorder:
+        return None
+    root = TreeNode(preorder[0])
+    nodes = [root]
+    stackPos = [pos[preorder[0]]]
+    for i in range(1, len(preorder)):
+        v = preorder[i]
+        p = pos[v]
+        node = TreeNode(v)
+        if p < stackPos[-1]:
+            nodes[-1].left = node
+        else:
+            while stackPos and stackPos[-1] < p:
+                parent = nodes.pop()
+                stackPos.pop()
+            parent.right = node
+        nodes.append(node)
+        stackPos.append(p)
+    return root
+
+
+def buildFlat(preorder, inorder):
+    pos = _positions(preorder, inorder)
+    n = len(preorder)
+    # same sweep, children recorded as preorder indices
+    preLeft = array('i', [-1]) * n
+    preRight = array('i', [-1]) * n
+    stack = array('i')
+    stackPos = array('i')
+    for i in range(n):
+        p = pos[preorder[i]]
+        if stack and p < stackPos[-1]:
+            preLeft[stack[-1]] = i
+        elif stack:
+            while stackPos and stackPos[-1] < p:
+                parent = stack.pop()
+                stackPos.pop()
+            preRight[parent] = i
+        stack.append(i)
+        stackPos.append(p)
+    del stack, stackPos, pos
+
+    # renumber preorder -> BFS: order[k] is the preorder index of BFS node k
+    order = array('i', [0] * min(n, 1))
+    for k in range(n):
+        i = order[k]
+        if preLeft[i] != -1:
+            order.append(preLeft[i])
+        if preRight[i] != -1:
+            order.append(preRight[i])
+    bfs = array('i', [0]) * n
+    for k in range(n):
+        bfs[order[k]] = k
+
+    val = array('q', [0]) * n
+    left = array('i', [-1]) * n
+    right = array('i', [-1]) * n
+    for k in range(n):
+        i = order[k]
+        try:
+            val[k] = preorder[i]
+        except (TypeError, OverflowError):
+            val = list(val)
+            val[k] = preorder[i]
+        if preLeft[i] != -1:
+            left[k] = bfs[preLeft[i]]
+        if preRight[i] != -1:
+            right[k] = bfs[preRight[i]]
+    return val, left, right
+
+
+if __name__ == '__main__':
+    #     3
+    #    / \
+    #   9   20
+    #      /  \
+    #     15   7
+    root = buildTree([3, 9, 20, 15, 7], [9, 3, 15, 20, 7])
+    print(root.val, root.left.val, root.right.val,
+          root.right.left.val, root.right.right.val)     # 3 9 20 15 7
+    print([list(part) for part in buildFlat([3, 9, 20, 15, 7], [9, 3, 15, 20, 7])])
+    # [[3, 9, 20, 15, 7], [1, -1, 3, -1, -1], [2, -1, 4, -1, -1]]
+    print(buildFlat(['b', 'a', 'c'], ['a', 'b', 'c'])[0])   # ['b', 'a', 'c']
+    print(buildTree([], []), [list(part) for part in buildFlat([], [])])
+    # None [[], [], []]
+
+    import time
+    n = 10 ** 6
+    inorder = list(range(n))
+    # balanced: preorder of the midpoint BST over 0..n-1
+    balanced, stack = [], [(0, n - 1)]
+    while stack:
+        l, r = stack.pop()
+        if l <= r:
+            m = (l + r) // 2
+            balanced.append(m)
+            stack.append((m + 1, r))
+            stack.append((l, m - 1))
+    # skewed: every node is the left child of the one before
+    leftChain = inorder[::-1]
+    # skewed the other way: every node is a right child
+    rightChain = inorder
+    for name, preorder in (('balanced', balanced), ('left chain', leftChain),
+                           ('right chain', rightChain)):
+        start = time.perf_counter()
+        buildTree(preorder, inorder)
+        linked = time.perf_counter() - start
+        start = time.perf_counter()
+        buildFlat(preorder, inorder)
+        print("%-11s n=%d  linked %.2fs  flat %.2fs"
+              % (name, n, linked, time.perf_counter() - start))
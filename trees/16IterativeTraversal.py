@@ -0,0 +1,111 @@
+# Iterative traversal engine for the tree problems
+#
+# The recursive versions (1balancedbinary, 2goodnodes, 3invertbinarytree,
+# 9sumroottoleaf, 13DiameterOfBinaryTree, 14HouseRobber3, and findHeight in
+# amazon_oa/sample2) used one python frame per level, so a linked list
+# shaped tree deeper than ~1000 raised RecursionError. The tree files now
+# load this one and run on two explicit-stack traversals (findHeight keeps
+# its own (node, depth) stack):
+#
+#   postorder(root, combine, empty)   bottom-up: returns
+#       combine(node, result(left), result(right)), empty for a None child
+#   preorder(root, step, init)        top-down: yields (node, carried) where
+#       carried is init for the root and step(parent, parentCarried) below
+#
+# The stacks are plain lists of node references (8 bytes per entry, no
+# tuple per node), so depth is only limited by memory.
+
+
+# the TreeNode every file in this folder uses
+class TreeNode:
+    __slots__ = ('val', 'left', 'right')
+
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+def postorder(root, combine, empty=None):
+    if root is None:
+        return empty
+    nodes = [root]
+    expanded = [False]
+    results = []
+    while nodes:
+        node = nodes.pop()
+        if expanded.pop():
+            right = results.pop() if node.right is not None else empty
+            left = results.pop() if node.left is not None else empty
+            results.append(combine(node, left, right))
+            continue
+        nodes.append(node)
+        expanded.append(True)
+        # right goes on first so the left result lands below the right one
+        if node.right is not None:
+            nodes.append(node.right)
+            expanded.append(False)
+        if node.left is not None:
+            nodes.append(node.left)
+            expanded.append(False)
+    return results[0]
+
+
+def preorder(root, step=None, init=None):
+    if root is None:
+        return
+    nodes = [root]
+    carried = [init]
+    while nodes:
+        node = nodes.pop()
+        value = carried.pop()
+        yield node, value
+        # children are read after the yield, so the caller may change them
+        below = step(node, value) if step is not None else None
+        if node.right is not None:
+            nodes.append(node.right)
+            carried.append(below)
+        if node.left is not None:
+            nodes.append(node.left)
+            carried.append(below)
+
+
+def height(root):
+    return postorder(root, lambda node, left, right: 1 + max(left, right), 0)
+
+
+if __name__ == '__main__':
+    import importlib
+    import sys
+    import time
+
+    # the ported tree files
+    isBalanced = importlib.import_module('1balancedbinary').isBalanced
+    goodNodes = importlib.import_module('2goodnodes').goodNode
+    invertTree = importlib.import_module('3invertbinarytree').invertTree
+    sumNumbers = importlib.import_module('9sumroottoleaf').sumNumbers
+    diameterOfBinaryTree = importlib.import_module('13DiameterOfBinaryTree').diameterOfBinaryTree
+    rob = importlib.import_module('14HouseRobber3').rob
+
+    #       3
+    #      / \
+    #     1   4
+    #    /   / \
+    #   3   1   5
+    root = TreeNode(3, TreeNode(1, TreeNode(3)), TreeNode(4, TreeNode(1), TreeNode(5)))
+    print(height(root), diameterOfBinaryTree(root), isBalanced(None, root))  # 3 4 True
+    print(goodNodes(root), rob(root), sumNumbers(root))  # 4 12 999
+    invertTree(root)
+    print(root.left.val, root.left.left.val, root.right.right.val)     # 4 5 3
+
+    # linked list shaped tree, far deeper than the recursion limit
+    # (sumNumbers is left out: its answer alone would have n digits)
+    # python 16IterativeTraversal.py 10000000
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    deep = None
+    for i in range(n):
+        deep = TreeNode(i % 10, deep)
+    start = time.perf_counter()
+    print(height(deep), diameterOfBinaryTree(deep), isBalanced(None, deep),
+          goodNodes(deep), rob(deep),
+          "%.2fs" % (time.perf_counter() - start))
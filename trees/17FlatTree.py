@@ -0,0 +1,179 @@
+# Flat tree: the whole tree in three parallel arrays
+#
+#   val[i]    array('q')  value of node i
+#   left[i]   array('i')  index of the left child, -1 for none
+#   right[i]  array('i')  index of the right child, -1 for none
+#
+# Nodes are numbered in BFS order, so node 0 is the root and every child
+# has a larger index than its parent. That makes every whole-tree
+# computation one loop over the arrays, no stack and no recursion:
+#   bottom-up (height, diameter, balanced, house robber): i = n-1 .. 0,
+#     both children are already done
+#   top-down (good nodes, sum root to leaf, width): i = 0 .. n-1,
+#     the parent is already done
+# 16 bytes per node, against ~90 for a TreeNode (even with __slots__)
+# once its boxed val and the reference to it are counted.
+
+import importlib
+import os
+import sys
+from array import array
+from collections import deque
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+TreeNode = importlib.import_module('16IterativeTraversal').TreeNode
+
+
+class FlatTree:
+    def __init__(self, val, left, right):
+        self.val = val
+        self.left = left
+        self.right = right
+
+    @classmethod
+    def fromLinked(cls, root):
+        val, left, right = array('q'), array('i'), array('i')
+        queue = deque([root] if root is not None else [])
+        count = len(queue)
+        while queue:
+            node = queue.popleft()
+            val.append(node.val)
+            for child, side in ((node.left, left), (node.right, right)):
+                if child is None:
+                    side.append(-1)
+                else:
+                    side.append(count)
+                    count += 1
+                    queue.append(child)
+        return cls(val, left, right)
+
+    def toLinked(self, nodeClass=TreeNode):
+        nodes = [nodeClass(v) for v in self.val]
+        for i, node in enumerate(nodes):
+            if self.left[i] != -1:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != -1:
+                node.right = nodes[self.right[i]]
+        return nodes[0] if nodes else None
+
+    def __len__(self):
+        return len(self.val)
+
+    # ---- bottom-up passes ----
+
+    def heights(self):
+        left, right = self.left, self.right
+        h = array('i', bytes(4 * (len(self) + 1)))    # h[-1] = 0 for "no child"
+        for i in range(len(self) - 1, -1, -1):
+            a, b = h[left[i]], h[right[i]]
+            h[i] = 1 + (a if a > b else b)
+        return h
+
+    def height(self):
+        return self.heights()[0] if len(self) else 0
+
+    def diameter(self):
+        left, right = self.left, self.right
+        h = self.heights()
+        return max((h[left[i]] + h[right[i]] for i in range(len(self))), default=0)
+
+    def isBalanced(self):
+        left, right = self.left, self.right
+        h = self.heights()
+        return all(abs(h[left[i]] - h[right[i]]) <= 1 for i in range(len(self)))
+
+    def rob(self):
+        val, left, right = self.val, self.left, self.right
+        n = len(self)
+        withRoot = array('q', bytes(8 * (n + 1)))
+        without = array('q', bytes(8 * (n + 1)))
+        for i in range(n - 1, -1, -1):
+            l, r = left[i], right[i]
+            withRoot[i] = val[i] + without[l] + without[r]
+            without[i] = max(withRoot[l], without[l]) + max(withRoot[r], without[r])
+        return max(withRoot[0], without[0]) if n else 0
+
+    # ---- top-down passes ----
+
+    def goodNodes(self):
+        val, left, right = self.val, self.left, self.right
+        n = len(self)
+        if not n:
+            return 0
+        best = array('q', [0]) * n     # max on the path from the root
+        best[0] = val[0]
+        good = 0
+        for i in range(n):
+            if val[i] >= best[i]:
+                good += 1
+                best[i] = val[i]
+            for child in (left[i], right[i]):
+                if child != -1:
+                    best[child] = best[i]
+        return good
+
+    def sumNumbers(self):
+        val, left, right = self.val, self.left, self.right
+        n = len(self)
+        number = [0] * n
+        total = 0
+        for i in range(n):
+            number[i] = number[i] * 10 + val[i]
+            if left[i] == -1 and right[i] == -1:
+                total += number[i]
+            for child in (left[i], right[i]):
+                if child != -1:
+                    number[child] = number[i]
+        return total
+
+    def width(self):
+        # BFS order lists the nodes level by level, so count each level
+        left, right = self.left, self.right
+        widest, levelEnd, nextEnd = 0, 1, 1
+        start = 0
+        for i in range(len(self)):
+            for child in (left[i], right[i]):
+                if child != -1:
+                    nextEnd = child + 1
+            if i + 1 == levelEnd:
+                widest = max(widest, levelEnd - start)
+                start, levelEnd = levelEnd, nextEnd
+        return widest
+
+
+if __name__ == '__main__':
+    #       3
+    #      / \
+    #     1   4
+    #    /   / \
+    #   3   1   5
+    root = TreeNode(3, TreeNode(1, TreeNode(3)), TreeNode(4, TreeNode(1), TreeNode(5)))
+    flat = FlatTree.fromLinked(root)
+    print(list(flat.val), list(flat.left), list(flat.right))
+    # [3, 1, 4, 3, 1, 5] [1, 3, 4, -1, -1, -1] [2, -1, 5, -1, -1, -1]
+    print(flat.height(), flat.diameter(), flat.isBalanced(), flat.width())  # 3 4 True 3
+    print(flat.goodNodes(), flat.rob(), flat.sumNumbers())                  # 4 12 999
+    print(FlatTree.fromLinked(flat.toLinked()).val == flat.val)             # True
+
+    import random
+    import time
+    import tracemalloc
+    n = 10 ** 6
+    tracemalloc.start()
+    nodes = [TreeNode(random.randrange(10 ** 6)) for _ in range(n)]
+    for i in range(1, n):
+        parent = nodes[(i - 1) // 2]
+        if i % 2:
+            parent.left = nodes[i]
+        else:
+            parent.right = nodes[i]
+    linked = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    flat = FlatTree.fromLinked(nodes[0])
+    flatBytes = sum(a.buffer_info()[1] * a.itemsize for a in (flat.val, flat.left, flat.right))
+    print("linked %.0f bytes/node, flat %.0f bytes/node" % (linked / n, flatBytes / n))
+    start = time.perf_counter()
+    print(flat.height(), flat.diameter(), flat.isBalanced(), flat.goodNodes(),
+          flat.rob() > 0, flat.width(), "%.2fs" % (time.perf_counter() - start))
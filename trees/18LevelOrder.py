@@ -0,0 +1,90 @@
+# Level order (BFS) iteration
+#
+#   levels(root)      generator, yields one level at a time as a list of
+#                     nodes; only the current frontier is ever held, the
+#                     next one is built while the caller works on this one
+#   levelStats(root)  one O(n) pass giving
+#                       height         number of levels
+#                       width          most nodes on one level
+#                       positionWidth  LeetCode 662 width: distance between
+#                                      the outermost nodes of a level,
+#                                      counting the None gaps between them
+#                       rightSide      last node value of every level
+#
+# None children are never queued. Positions are renumbered from 0 on every
+# level, so they stay small ints even on very deep, sparse trees.
+
+
+def levels(root):
+    frontier = [root] if root is not None else []
+    while frontier:
+        yield frontier
+        following = []
+        for node in frontier:
+            if node.left is not None:
+                following.append(node.left)
+            if node.right is not None:
+                following.append(node.right)
+        frontier = following
+
+
+def levelStats(root):
+    height = width = positionWidth = 0
+    rightSide = []
+    nodes = [root] if root is not None else []
+    positions = [0] if root is not None else []
+    while nodes:
+        height += 1
+        width = max(width, len(nodes))
+        first = positions[0]
+        positionWidth = max(positionWidth, positions[-1] - first + 1)
+        rightSide.append(nodes[-1].val)
+
+        nextNodes, nextPositions = [], []
+        for node, pos in zip(nodes, positions):
+            pos = 2 * (pos - first)
+            if node.left is not None:
+                nextNodes.append(node.left)
+                nextPositions.append(pos)
+            if node.right is not None:
+                nextNodes.append(node.right)
+                nextPositions.append(pos + 1)
+        nodes, positions = nextNodes, nextPositions
+
+    return {'height': height, 'width': width,
+            'positionWidth': positionWidth, 'rightSide': rightSide}
+
+
+if __name__ == '__main__':
+    import importlib
+    TreeNode = importlib.import_module('16IterativeTraversal').TreeNode
+
+    #        1
+    #       / \
+    #      3   2
+    #     /     \
+    #    5       9
+    #   /         \
+    #  6           7
+    root = TreeNode(1, TreeNode(3, TreeNode(5, TreeNode(6))),
+                    TreeNode(2, None, TreeNode(9, None, TreeNode(7))))
+    print([[node.val for node in level] for level in levels(root)])
+    # [[1], [3, 2], [5, 9], [6, 7]]
+    print(levelStats(root))
+    # {'height': 4, 'width': 2, 'positionWidth': 8, 'rightSide': [1, 2, 9, 7]}
+    print(levelStats(None))
+    # {'height': 0, 'width': 0, 'positionWidth': 0, 'rightSide': []}
+
+    import time
+    n = 10 ** 6
+    nodes = [TreeNode(i) for i in range(n)]
+    for i in range(1, n):
+        parent = nodes[(i - 1) // 2]
+        if i % 2:
+            parent.left = nodes[i]
+        else:
+            parent.right = nodes[i]
+    start = time.perf_counter()
+    stats = levelStats(nodes[0])
+    print(stats['height'], stats['width'], stats['positionWidth'],
+          "%.2fs" % (time.perf_counter() - start))
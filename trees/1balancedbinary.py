@@ -1,11 +1,19 @@
-def isBalanced(self, root):
+import importlib
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+postorder = importlib.import_module('16IterativeTraversal').postorder
 
-    def dfs(root):
-        if not root:
-            return [True, 0] # Balanced, height 
 
-        left = dfs(root.left)
-        right = dfs(root.right)
+def isBalanced(self, root):
+
+    # [Balanced, height] bottom up on an explicit stack
+    def combine(root, left, right):
         balanced = (left[0] and right[0] and abs(left[1] - right[1]) <= 1)
 
-        return [balanced, 1 + max(left[1], right[1])]
\ No newline at end of file
+        return [balanced, 1 + max(left[1], right[1])]
+
+    return postorder(root, combine, [True, 0])[0]
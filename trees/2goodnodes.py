@@ -1,16 +1,23 @@
+import importlib
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+preorder = importlib.import_module('16IterativeTraversal').preorder
 
-def goodNode(root):
 
-    def dfs(node, maxVal):
-        if not node:
-            return 0
+def goodNode(root):
 
-        ret = 1 if node.val >=  maxVal else 0
-        maxVal = max(maxVal, node.val)
+    if not root:
+        return 0
 
-        ret += dfs(node.left, maxVal)
-        ret += dfs(node.right, maxVal)
+    # every node comes with the max value on its path from the root
+    step = lambda node, maxVal: max(maxVal, node.val)
 
-        return ret
+    ret = 0
+    for node, maxVal in preorder(root, step, root.val):
+        ret += 1 if node.val >=  maxVal else 0
 
-    dfs(root,root.val)
\ No newline at end of file
+    return ret
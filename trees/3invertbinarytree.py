@@ -1,13 +1,19 @@
-def invertTree(root):
+import importlib
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+preorder = importlib.import_module('16IterativeTraversal').preorder
 
-    if not root:
-        return None
 
-    tmp = root.left 
-    root.left = root.right
-    root.right = tmp
+def invertTree(root):
 
-    invertTree(root.left)
-    invertTree(root.right)
+    # preorder reads the children after each node is swapped
+    for node, _ in preorder(root):
+        tmp = node.left 
+        node.left = node.right
+        node.right = tmp
 
-    return root
\ No newline at end of file
+    return root
@@ -1,3 +1,14 @@
+import importlib
+import os
+import sys
+from array import array
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+TreeNode = importlib.import_module('16IterativeTraversal').TreeNode
+
+
 def sortedArrayToBST( nums):
 
     def helper(l, r):
@@ -12,3 +23,114 @@ def sortedArrayToBST( nums):
         return root
 
     return helper(0, len(nums)- 1)
+
+
+# Same tree as sortedArrayToBST, but the keys come from an iterator (e.g. a
+# sorted file) and are never put in a list. Nodes are created in in-order,
+# so each one just takes next(values): helper(l, r) is run on an explicit
+# stack of (l, r, stage) frames, only O(log n) deep, and O(n) time overall.
+#
+# n: number of keys. If not given, len(values) is used, or for a
+# re-iterable source (a file path wrapper, a range, ...) one counting pass.
+def sortedIteratorToBST(values, n=None):
+    n = _length(values, n)
+    it = iter(values)
+    built = []                  # finished subtrees waiting for their parent
+    stack = [(0, n - 1, 0)]
+    while stack:
+        l, r, stage = stack.pop()
+        if l > r:
+            built.append(None)
+        elif stage == 0:        # left subtree first
+            stack.append((l, r, 1))
+            stack.append((l, (l + r) // 2 - 1, 0))
+        elif stage == 1:        # then this node, then the right subtree
+            root = TreeNode(next(it), built.pop())
+            built.append(root)
+            stack.append((l, r, 2))
+            stack.append(((l + r) // 2 + 1, r, 0))
+        else:
+            right = built.pop()
+            built[-1].right = right
+    return built[0]
+
+
+# Same shape again, emitted straight into the flat layout of 17FlatTree.py
+# (BFS ordered val / left / right arrays, -1 for no child):
+# FlatTree(*sortedIteratorToFlat(values)).
+# The BFS numbering only depends on n, so the shape is laid out first
+# (lo / hi hold the key range of every BFS slot) and then the keys are
+# streamed into their slots in order.
+# val is an array('q') for int keys; the first key that doesn't fit
+# (str, float, an int past 64 bits) turns it into a plain list.
+def sortedIteratorToFlat(values, n=None):
+    n = _length(values, n)
+    left = array('i', [-1]) * n
+    right = array('i', [-1]) * n
+    lo = array('i', [0]) * n
+    hi = array('i', [n - 1]) * n
+    slot = array('i', [0]) * n      # in-order position -> BFS index
+    count = 1 if n else 0
+    for i in range(n):
+        l, r = lo[i], hi[i]
+        m = (l + r) // 2
+        slot[m] = i
+        if l <= m - 1:
+            left[i] = count
+            lo[count], hi[count] = l, m - 1
+            count += 1
+        if m + 1 <= r:
+            right[i] = count
+            lo[count], hi[count] = m + 1, r
+            count += 1
+    del lo, hi
+
+    val = array('q', [0]) * n
+    for position, key in zip(range(n), values):
+        try:
+            val[slot[position]] = key
+        except (TypeError, OverflowError):
+            val = list(val)
+            val[slot[position]] = key
+    return val, left, right
+
+
+def _length(values, n):
+    if n is not None:
+        return n
+    if hasattr(values, '__len__'):
+        return len(values)
+    if iter(values) is values:
+        raise ValueError("pass n= for a one-shot iterator")
+    return sum(1 for _ in values)
+
+
+if __name__ == '__main__':
+    def inorder(root):
+        out, stack = [], []
+        while stack or root:
+            while root:
+                stack.append(root)
+                root = root.left
+            root = stack.pop()
+            out.append(root.val)
+            root = root.right
+        return out
+
+    nums = [-10, -3, 0, 5, 9]
+    a = sortedArrayToBST(nums)
+    b = sortedIteratorToBST(iter(nums), len(nums))
+    print(a.val, b.val, b.left.val, b.right.val)   # 0 0 -10 5
+    print(inorder(b))                              # [-10, -3, 0, 5, 9]
+    print([list(part) for part in sortedIteratorToFlat(range(7))])
+    # [[3, 1, 5, 0, 2, 4, 6], [1, 3, 5, -1, -1, -1, -1], [2, 4, 6, -1, -1, -1, -1]]
+    print(sortedIteratorToFlat(['a', 'b', 'c'])[0])  # ['b', 'a', 'c']
+
+    import time
+    n = 10 ** 6
+    start = time.perf_counter()
+    root = sortedIteratorToBST((x * 2 for x in range(n)), n)
+    print(inorder(root)[-3:], "linked %.2fs" % (time.perf_counter() - start))
+    start = time.perf_counter()
+    val, left, right = sortedIteratorToFlat(range(n))
+    print(val[0], "flat %.2fs" % (time.perf_counter() - start))
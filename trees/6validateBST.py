@@ -1,13 +1,123 @@
+# Validate binary search tree
+#
+#   validateBST(root) -> (valid, path, aggregates)
+#     one iterative pass that checks the in-order stream is strictly
+#     increasing and stops at the first value that is not. path is then the
+#     list of nodes from the root down to that node ([] when valid).
+#     aggregates maps every finished subtree root to
+#     (size, min, max, sum); on an early exit only the subtrees that were
+#     completed before the violation are in it.
+#   rangeSum(root, aggregates, low, high) -> (count, sum) of the keys in
+#     [low, high], O(height) by reusing the aggregates instead of walking
+#     the matching nodes.
+#
+# The traversal is a state machine on an explicit stack, so the stack is
+# always exactly the path from the root to the current node:
+#   0 go left, 1 visit (in-order check) and go right, 2 combine aggregates
+
+
 def isValidBST(root):
+    return validateBST(root)[0]
+
+
+def validateBST(root):
+    aggregates = {}
+    if root is None:
+        return True, [], aggregates
+    path = [root]
+    state = [0]
+    prev = None
+    first = True
+    while path:
+        node = path[-1]
+        s = state[-1]
+        if s == 0:
+            state[-1] = 1
+            if node.left is not None:
+                path.append(node.left)
+                state.append(0)
+        elif s == 1:
+            if not first and node.val <= prev:
+                return False, list(path), aggregates
+            prev = node.val
+            first = False
+            state[-1] = 2
+            if node.right is not None:
+                path.append(node.right)
+                state.append(0)
+        else:
+            path.pop()
+            state.pop()
+            # the subtree passed the in-order check, so its min is the
+            # leftmost key and its max the rightmost
+            size, low, high, total = 1, node.val, node.val, node.val
+            if node.left is not None:
+                leftSize, low, _, leftTotal = aggregates[node.left]
+                size += leftSize
+                total += leftTotal
+            if node.right is not None:
+                rightSize, _, high, rightTotal = aggregates[node.right]
+                size += rightSize
+                total += rightTotal
+            aggregates[node] = (size, low, high, total)
+    return True, [], aggregates
+
+
+# (count, sum) of the keys < bound, or <= bound with inclusive=True
+def _prefix(root, aggregates, bound, inclusive):
+    count = total = 0
+    node = root
+    while node is not None:
+        if node.val < bound or (inclusive and node.val == bound):
+            count += 1
+            total += node.val
+            if node.left is not None:
+                leftSize, _, _, leftTotal = aggregates[node.left]
+                count += leftSize
+                total += leftTotal
+            node = node.right
+        else:
+            node = node.left
+    return count, total
+
+
+def rangeSum(root, aggregates, low, high):
+    if low > high:
+        return 0, 0
+    upToHigh = _prefix(root, aggregates, high, True)
+    belowLow = _prefix(root, aggregates, low, False)
+    return upToHigh[0] - belowLow[0], upToHigh[1] - belowLow[1]
+
+
+if __name__ == '__main__':
+    import importlib
+    TreeNode = importlib.import_module('16IterativeTraversal').TreeNode
 
-    def validate(node, left, right):
-        if not node:
-            return True
-        if not (node.val < right and node.val > right):
-            return False
+    #       10
+    #      /  \
+    #     5    15
+    #    / \     \
+    #   3   7     18
+    root = TreeNode(10, TreeNode(5, TreeNode(3), TreeNode(7)),
+                    TreeNode(15, None, TreeNode(18)))
+    valid, path, aggregates = validateBST(root)
+    print(valid, path, aggregates[root], aggregates[root.left])
+    # True [] (6, 3, 18, 58) (3, 3, 7, 15)
+    print(rangeSum(root, aggregates, 7, 15))      # (3, 32)
 
-        return  (validate(node.left, left, node.val) and
-        validate(node.right, node.val, right))
+    root.right.right.val = 12                     # 12 is not > 15
+    valid, path, _ = validateBST(root)
+    print(valid, [node.val for node in path])     # False [10, 15, 12]
+    print(isValidBST(TreeNode(2, TreeNode(1), TreeNode(3))),
+          isValidBST(TreeNode(2, TreeNode(2))))   # True False
 
-        
-    return validate(root, float("-inf"), float("inf"))
\ No newline at end of file
+    # right chain far deeper than the recursion limit
+    import time
+    n = 10 ** 6
+    chain = None
+    for i in range(n - 1, -1, -1):
+        chain = TreeNode(i, None, chain)
+    start = time.perf_counter()
+    valid, path, aggregates = validateBST(chain)
+    print(valid, aggregates[chain], rangeSum(chain, aggregates, 10, 19),
+          "%.2fs" % (time.perf_counter() - start))
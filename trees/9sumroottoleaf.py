@@ -1,17 +1,21 @@
+import importlib
+import os
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+preorder = importlib.import_module('16IterativeTraversal').preorder
 
-def sumNumbers(root):
 
-    def dfs(node, curr):
-        if not node:
-            return 0
+def sumNumbers(root):
 
-        curr = (curr * 10) + node.val
+    # every node comes with the number formed above it
+    step = lambda node, curr: (curr * 10) + node.val
 
+    total = 0
+    for node, curr in preorder(root, step, 0):
         if not node.left and not node.right:
-            return curr
-
-        return dfs(node.left, curr) +  dfs(node.right, curr)
+            total += (curr * 10) + node.val
 
-    return dfs(root, 0)
-    
-        
\ No newline at end of file
+    return total